@@ -19,20 +19,30 @@ import json
 import os
 import sqlite3
 import logging
+import logging.handlers
 import threading
 import time
 import hashlib
 import re
+import uuid
+from operator import attrgetter
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 import subprocess
 import socket
 import ssl
 from urllib.parse import urlparse
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ScanType(Enum):
     """Types of security scans."""
@@ -41,6 +51,8 @@ class ScanType(Enum):
     FILE_INTEGRITY = "file_integrity"
     NETWORK = "network"
     COMPLIANCE = "compliance"
+    ASSET = "asset"
+    COMPREHENSIVE = "comprehensive"
 
 
 class Severity(Enum):
@@ -51,6 +63,21 @@ class Severity(Enum):
     CRITICAL = "critical"
 
 
+_get_severity = attrgetter('severity')
+
+_LOG_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+# Enum -> column value lookups, built once for the INSERT paths
+_SCAN_TYPE_VALUES = {scan_type: scan_type.value for scan_type in ScanType}
+_SEVERITY_VALUES = {severity: severity.value for severity in Severity}
+
+
 class ComplianceStandard(Enum):
     """Compliance standards."""
     NIST = "nist"
@@ -60,6 +87,30 @@ class ComplianceStandard(Enum):
     HIPAA = "hipaa"
 
 
+def _dump_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Serialize a metadata dict for storage, keeping None and empty dicts as SQL NULL."""
+    if not metadata:
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(metadata).decode()
+    return json.dumps(metadata)
+
+
+def _load_metadata(raw: Optional[str]) -> Dict[str, Any]:
+    """Deserialize a stored metadata column, mapping NULL to an empty dict."""
+    if not raw:
+        return {}
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _finding_id(prefix: str, *parts: Any) -> str:
+    """Build a finding ID that is stable across runs and processes."""
+    key = "|".join(map(str, parts)).encode()
+    return f"{prefix}_{hashlib.blake2b(key, digest_size=6).hexdigest()}"
+
+
 @dataclass
 class SecurityFinding:
     """Data class to hold security finding information."""
@@ -76,6 +127,19 @@ class SecurityFinding:
     resolved_at: Optional[str] = None
     metadata: Dict[str, Any] = None
 
+    @classmethod
+    def from_row(cls, row: Tuple) -> 'SecurityFinding':
+        """Build a finding from a security_findings row in column order."""
+        (finding_id, scan_type, target, severity, title, description,
+         recommendation, cvss_score, status, created_at, resolved_at, metadata) = row
+        return cls(
+            id=finding_id, scan_type=ScanType(scan_type), target=target,
+            severity=Severity(severity), title=title, description=description,
+            recommendation=recommendation, cvss_score=cvss_score, status=status,
+            created_at=created_at, resolved_at=resolved_at,
+            metadata=_load_metadata(metadata)
+        )
+
 
 @dataclass
 class ScanReport:
@@ -101,19 +165,36 @@ class AssetDiscoverer:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger('AssetDiscoverer')
+        # Near-static probes are cached per instance as (value, expires_at) pairs
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        cache_config = config.get('asset_cache', {})
+        self.static_ttl = cache_config.get('static_ttl_seconds', 300)
+        self.network_ttl = cache_config.get('network_ttl_seconds', 30)
 
     def discover_system_assets(self) -> Dict[str, Any]:
         """Discover system-level assets."""
         assets = {
-            "operating_system": self._get_os_info(),
-            "hardware": self._get_hardware_info(),
+            "operating_system": self._get_cached("os_info", self.static_ttl, self._get_os_info),
+            "hardware": self._get_cached("hardware_info", self.static_ttl, self._get_hardware_info),
             "installed_software": self._get_installed_software(),
             "running_processes": self._get_running_processes(),
-            "network_interfaces": self._get_network_interfaces(),
+            "network_interfaces": self._get_cached("network_interfaces", self.network_ttl,
+                                                   self._get_network_interfaces),
             "listening_ports": self._get_listening_ports()
         }
         return assets
 
+    def _get_cached(self, key: str, ttl: float, loader):
+        """Return a cached probe result, re-collecting it once the TTL has expired."""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        value = loader()
+        self._cache[key] = (value, now + ttl)
+        return value
+
     def _get_os_info(self) -> Dict[str, str]:
         """Get operating system information."""
         import platform
@@ -244,42 +325,82 @@ class AssetDiscoverer:
 
     def _get_listening_ports(self) -> List[Dict[str, str]]:
         """Get list of listening ports."""
+        listening_ports = self._get_listening_ports_ss()
+        if listening_ports is not None:
+            return listening_ports
+
         listening_ports = []
         try:
             import psutil
-            connections = psutil.net_connections(kind='inet')
-
-            for conn in connections:
-                if conn.status == 'LISTEN':
-                    listening_ports.append({
-                        "port": conn.laddr.port,
-                        "address": conn.laddr.ip,
-                        "protocol": "tcp" if conn.type == 1 else "udp",
-                        "pid": conn.pid if conn.pid else None
-                    })
+            connections = psutil.net_connections(kind='tcp')
+
+            listening_ports = [
+                {
+                    "port": conn.laddr.port,
+                    "address": conn.laddr.ip,
+                    "protocol": "tcp",
+                    "pid": conn.pid if conn.pid else None
+                }
+                for conn in connections if conn.status == 'LISTEN'
+            ]
         except Exception as e:
             self.logger.error(f"Error getting listening ports: {e}")
 
         return listening_ports
 
+    def _get_listening_ports_ss(self) -> Optional[List[Dict[str, str]]]:
+        """Get listening TCP ports from `ss`, which filters to listeners in the kernel."""
+        try:
+            result = subprocess.run(["ss", "-tlnHp"], capture_output=True, text=True, timeout=10)
+        except Exception as e:
+            self.logger.debug(f"Could not get listening ports via ss: {e}")
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        listening_ports = []
+        for line in result.stdout.splitlines():
+            # LISTEN 0 128 0.0.0.0:22 0.0.0.0:* users:(("sshd",pid=1234,fd=3))
+            parts = line.split(None, 5)
+            if len(parts) < 5:
+                continue
+
+            address, _, port = parts[3].rpartition(':')
+            if not port.isdigit():
+                continue
+            address = address.strip('[]').split('%', 1)[0]
+
+            pid_match = re.search(r"pid=(\d+)", parts[5]) if len(parts) > 5 else None
+            listening_ports.append({
+                "port": int(port),
+                "address": address,
+                "protocol": "tcp",
+                "pid": int(pid_match.group(1)) if pid_match else None
+            })
+
+        return listening_ports
+
 
 class VulnerabilityScanner:
     """Scans for vulnerabilities in the system."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], asset_discoverer: Optional[AssetDiscoverer] = None):
         self.config = config
         self.logger = logging.getLogger('VulnerabilityScanner')
+        self.asset_discoverer = asset_discoverer or AssetDiscoverer(config)
 
     def scan_for_vulnerabilities(self, target: str) -> List[SecurityFinding]:
         """Scan for vulnerabilities in the specified target."""
         findings = []
+        now = datetime.now().isoformat()
 
         # For this example, we'll simulate finding some common vulnerabilities
         # In a real implementation, this would interface with vulnerability databases
 
         # Check for outdated software
         if target == "system":
-            assets = AssetDiscoverer(self.config).discover_system_assets()
+            assets = self.asset_discoverer.discover_system_assets()
             software_list = assets.get('installed_software', [])
 
             for software in software_list:
@@ -289,7 +410,7 @@ class VulnerabilityScanner:
                 # Simulate checking for known vulnerable software
                 if 'openssl' in name and version.startswith('1.0'):
                     finding = SecurityFinding(
-                        id=f"vuln_{hash('openssl_1.0_outdated') % 100000}",
+                        id=_finding_id("vuln", "openssl_1.0_outdated"),
                         scan_type=ScanType.VULNERABILITY,
                         target=target,
                         severity=Severity.HIGH,
@@ -298,14 +419,14 @@ class VulnerabilityScanner:
                         recommendation="Upgrade to the latest stable version of OpenSSL",
                         cvss_score=7.5,
                         status="open",
-                        created_at=datetime.now().isoformat(),
+                        created_at=now,
                         metadata={"software_name": name, "version": version}
                     )
                     findings.append(finding)
 
         # Simulate finding other common vulnerabilities
         finding1 = SecurityFinding(
-            id=f"vuln_{hash('missing_patch_example') % 100000}",
+            id=_finding_id("vuln", "missing_patch_example"),
             scan_type=ScanType.VULNERABILITY,
             target=target,
             severity=Severity.MEDIUM,
@@ -314,7 +435,7 @@ class VulnerabilityScanner:
             recommendation="Install the latest security updates",
             cvss_score=6.5,
             status="open",
-            created_at=datetime.now().isoformat(),
+            created_at=now,
             metadata={"patch_type": "security", "urgency": "recommended"}
         )
         findings.append(finding1)
@@ -328,10 +449,12 @@ class ConfigurationAuditor:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.logger = logging.getLogger('ConfigurationAuditor')
+        self.stat_workers = config.get('scanning', {}).get('stat_workers', 16)
 
     def audit_configurations(self, target: str) -> List[SecurityFinding]:
         """Audit configurations in the specified target."""
         findings = []
+        now = datetime.now().isoformat()
 
         # Check SSH configuration
         ssh_config_path = "/etc/ssh/sshd_config"
@@ -345,7 +468,7 @@ class ConfigurationAuditor:
             world_writable = self._find_world_writable_files()
             for item in world_writable:
                 finding = SecurityFinding(
-                    id=f"cfg_{hash(f'world_writable_{item}') % 100000}",
+                    id=_finding_id("cfg", "world_writable", item),
                     scan_type=ScanType.CONFIGURATION,
                     target=item,
                     severity=Severity.HIGH,
@@ -354,7 +477,7 @@ class ConfigurationAuditor:
                     recommendation="Remove world-write permissions using chmod",
                     cvss_score=7.8,
                     status="open",
-                    created_at=datetime.now().isoformat(),
+                    created_at=now,
                     metadata={"path": item, "type": "permissions"}
                 )
                 findings.append(finding)
@@ -364,6 +487,7 @@ class ConfigurationAuditor:
     def _audit_ssh_config(self, config_path: str) -> List[SecurityFinding]:
         """Audit SSH configuration file."""
         findings = []
+        now = datetime.now().isoformat()
 
         try:
             with open(config_path, 'r') as f:
@@ -381,7 +505,7 @@ class ConfigurationAuditor:
             # Check for insecure SSH settings
             if ssh_settings.get('permitrootlogin', 'yes') == 'yes':
                 finding = SecurityFinding(
-                    id=f"cfg_{hash('ssh_permit_root_login') % 100000}",
+                    id=_finding_id("cfg", "ssh_permit_root_login"),
                     scan_type=ScanType.CONFIGURATION,
                     target=config_path,
                     severity=Severity.HIGH,
@@ -390,14 +514,14 @@ class ConfigurationAuditor:
                     recommendation="Set PermitRootLogin to 'no' in SSH configuration",
                     cvss_score=8.0,
                     status="open",
-                    created_at=datetime.now().isoformat(),
+                    created_at=now,
                     metadata={"setting": "PermitRootLogin", "value": ssh_settings.get('permitrootlogin')}
                 )
                 findings.append(finding)
 
             if ssh_settings.get('passwordauthentication', 'yes') == 'yes':
                 finding = SecurityFinding(
-                    id=f"cfg_{hash('ssh_password_auth') % 100000}",
+                    id=_finding_id("cfg", "ssh_password_auth"),
                     scan_type=ScanType.CONFIGURATION,
                     target=config_path,
                     severity=Severity.MEDIUM,
@@ -406,7 +530,7 @@ class ConfigurationAuditor:
                     recommendation="Disable PasswordAuthentication and use public key authentication",
                     cvss_score=5.5,
                     status="open",
-                    created_at=datetime.now().isoformat(),
+                    created_at=now,
                     metadata={"setting": "PasswordAuthentication", "value": ssh_settings.get('passwordauthentication')}
                 )
                 findings.append(finding)
@@ -418,7 +542,7 @@ class ConfigurationAuditor:
 
     def _find_world_writable_files(self) -> List[str]:
         """Find world-writable files and directories."""
-        world_writable = []
+        candidates = []
 
         # Only check certain safe directories to avoid system traversal
         safe_dirs = ["/tmp", "/var/tmp"]
@@ -427,20 +551,8 @@ class ConfigurationAuditor:
             if os.path.exists(directory):
                 try:
                     for root, dirs, files in os.walk(directory):
-                        # Check directory permissions
-                        dir_stat = os.stat(root)
-                        if dir_stat.st_mode & 0o002:  # World writable
-                            world_writable.append(root)
-
-                        # Check file permissions
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            try:
-                                file_stat = os.stat(file_path)
-                                if file_stat.st_mode & 0o002:  # World writable
-                                    world_writable.append(file_path)
-                            except OSError:
-                                continue  # Skip if can't stat file
+                        candidates.append(root)
+                        candidates.extend(os.path.join(root, file) for file in files)
 
                         # Limit depth to prevent excessive recursion
                         if root.count(os.sep) - directory.count(os.sep) >= 3:
@@ -449,15 +561,28 @@ class ConfigurationAuditor:
                 except Exception as e:
                     self.logger.error(f"Error checking permissions in {directory}: {e}")
 
-        return world_writable
+        # stat() releases the GIL, so slow filesystems (NFS, FUSE) overlap across threads
+        with ThreadPoolExecutor(max_workers=self.stat_workers) as executor:
+            modes = executor.map(self._stat_mode, candidates)
+            return [path for path, mode in zip(candidates, modes)
+                    if mode is not None and mode & 0o002]  # World writable
+
+    @staticmethod
+    def _stat_mode(path: str) -> Optional[int]:
+        """Return the permission bits of a path, or None if it cannot be stat'ed."""
+        try:
+            return os.stat(path).st_mode
+        except OSError:
+            return None  # Skip if can't stat file
 
 
 class ComplianceChecker:
     """Checks compliance with security standards."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], asset_discoverer: Optional[AssetDiscoverer] = None):
         self.config = config
         self.logger = logging.getLogger('ComplianceChecker')
+        self.asset_discoverer = asset_discoverer or AssetDiscoverer(config)
 
     def check_compliance(self, standard: str, target: str) -> Dict[str, Any]:
         """Check compliance against the specified standard."""
@@ -478,14 +603,15 @@ class ComplianceChecker:
     def _check_nist_compliance(self, target: str) -> Dict[str, Any]:
         """Check NIST Cybersecurity Framework compliance."""
         findings = []
+        now = datetime.now().isoformat()
 
         # Example: Check for basic NIST framework elements
-        assets = AssetDiscoverer(self.config).discover_system_assets()
+        assets = self.asset_discoverer.discover_system_assets()
 
         # Identify function - check if assets are inventoried
         if not assets:
             finding = SecurityFinding(
-                id=f"comp_{hash('nist_no_assets') % 100000}",
+                id=_finding_id("comp", "nist_no_assets"),
                 scan_type=ScanType.COMPLIANCE,
                 target=target,
                 severity=Severity.HIGH,
@@ -494,7 +620,7 @@ class ComplianceChecker:
                 recommendation="Implement system asset discovery and inventory",
                 cvss_score=7.0,
                 status="open",
-                created_at=datetime.now().isoformat(),
+                created_at=now,
                 metadata={"nist_function": "identify", "requirement": "asset_inventory"}
             )
             findings.append(finding)
@@ -504,7 +630,7 @@ class ComplianceChecker:
         firewall_active = self._check_firewall_active()
         if not firewall_active:
             finding = SecurityFinding(
-                id=f"comp_{hash('nist_no_firewall') % 100000}",
+                id=_finding_id("comp", "nist_no_firewall"),
                 scan_type=ScanType.COMPLIANCE,
                 target=target,
                 severity=Severity.HIGH,
@@ -513,7 +639,7 @@ class ComplianceChecker:
                 recommendation="Enable and configure system firewall",
                 cvss_score=7.5,
                 status="open",
-                created_at=datetime.now().isoformat(),
+                created_at=now,
                 metadata={"nist_function": "protect", "requirement": "firewall"}
             )
             findings.append(finding)
@@ -535,6 +661,7 @@ class ComplianceChecker:
     def _check_iso27001_compliance(self, target: str) -> Dict[str, Any]:
         """Check ISO 27001 compliance."""
         findings = []
+        now = datetime.now().isoformat()
 
         # Check for basic ISMS elements
         # This is a simplified check - real implementation would be much more detailed
@@ -551,7 +678,7 @@ class ComplianceChecker:
 
         if not has_security_policies:
             finding = SecurityFinding(
-                id=f"comp_{hash('iso_no_policies') % 100000}",
+                id=_finding_id("comp", "iso_no_policies"),
                 scan_type=ScanType.COMPLIANCE,
                 target=target,
                 severity=Severity.HIGH,
@@ -560,7 +687,7 @@ class ComplianceChecker:
                 recommendation="Implement security policies and procedures",
                 cvss_score=7.0,
                 status="open",
-                created_at=datetime.now().isoformat(),
+                created_at=now,
                 metadata={"iso_section": "Clause 6.1", "requirement": "establish_security_policies"}
             )
             findings.append(finding)
@@ -608,12 +735,13 @@ class ThreatDetector:
     def detect_threats(self, target: str) -> List[SecurityFinding]:
         """Detect potential threats in the specified target."""
         findings = []
+        now = datetime.now().isoformat()
 
         # Check for common threat indicators
         suspicious_processes = self._find_suspicious_processes()
         for proc in suspicious_processes:
             finding = SecurityFinding(
-                id=f"thr_{hash(f'suspicious_proc_{proc}') % 100000}",
+                id=_finding_id("thr", "suspicious_proc", proc),
                 scan_type=ScanType.NETWORK,
                 target=proc,
                 severity=Severity.HIGH,
@@ -622,7 +750,7 @@ class ThreatDetector:
                 recommendation="Investigate the process and terminate if malicious",
                 cvss_score=8.0,
                 status="open",
-                created_at=datetime.now().isoformat(),
+                created_at=now,
                 metadata={"process_name": proc, "type": "process_monitoring"}
             )
             findings.append(finding)
@@ -661,6 +789,14 @@ class SecurityDatabase:
 
     def __init__(self, db_path: str = ":memory:"):
         self.db_path = db_path
+        # One connection shared by all threads; the lock serializes transactions on it
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        if self.db_path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA temp_store=MEMORY")
+            self._conn.execute("PRAGMA cache_size=-20000")  # ~20MB page cache
         self.init_database()
 
     def init_database(self):
@@ -682,6 +818,14 @@ class SecurityDatabase:
                     metadata TEXT
                 )
             ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_findings_severity
+                ON security_findings(severity)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_findings_scan_type
+                ON security_findings(scan_type)
+            ''')
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS scan_reports (
                     id TEXT PRIMARY KEY,
@@ -702,31 +846,54 @@ class SecurityDatabase:
 
     @contextmanager
     def get_connection(self):
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Get the shared database connection for the duration of one transaction."""
+        with self._lock:
+            try:
+                yield self._conn
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def close(self):
+        """Close the shared database connection."""
+        with self._lock:
+            self._conn.close()
+
+    _UPSERT_FINDING_SQL = '''
+        INSERT INTO security_findings
+        (id, scan_type, target, severity, title, description, recommendation,
+         cvss_score, status, created_at, resolved_at, metadata)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            status = excluded.status,
+            resolved_at = excluded.resolved_at,
+            metadata = excluded.metadata
+    '''
 
     def add_finding(self, finding: SecurityFinding):
-        """Add a security finding to the database."""
+        """Add a security finding to the database, updating it if it was already recorded."""
         with self.get_connection() as conn:
-            conn.execute('''
-                INSERT INTO security_findings
-                (id, scan_type, target, severity, title, description, recommendation,
-                 cvss_score, status, created_at, resolved_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                finding.id, finding.scan_type.value, finding.target,
-                finding.severity.value, finding.title, finding.description,
-                finding.recommendation, finding.cvss_score, finding.status,
-                finding.created_at, finding.resolved_at, json.dumps(finding.metadata)
-            ))
+            conn.execute(self._UPSERT_FINDING_SQL, self._finding_row(finding))
+
+    def add_findings_bulk(self, findings: List[SecurityFinding]):
+        """Add several security findings in a single transaction."""
+        if not findings:
+            return
+
+        rows = [self._finding_row(finding) for finding in findings]
+        with self.get_connection() as conn:
+            conn.executemany(self._UPSERT_FINDING_SQL, rows)
+
+    @staticmethod
+    def _finding_row(finding: SecurityFinding) -> Tuple:
+        """Build the security_findings parameter tuple for a finding."""
+        return (
+            finding.id, _SCAN_TYPE_VALUES[finding.scan_type], finding.target,
+            _SEVERITY_VALUES[finding.severity], finding.title, finding.description,
+            finding.recommendation, finding.cvss_score, finding.status,
+            finding.created_at, finding.resolved_at, _dump_metadata(finding.metadata)
+        )
 
     def add_scan_report(self, report: ScanReport):
         """Add a scan report to the database."""
@@ -738,10 +905,10 @@ class SecurityDatabase:
                  error_message, metadata)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
-                report.id, report.scan_type.value, report.target, report.status,
+                report.id, _SCAN_TYPE_VALUES[report.scan_type], report.target, report.status,
                 report.total_findings, report.critical_findings, report.high_findings,
                 report.medium_findings, report.low_findings, report.start_time,
-                report.end_time, report.error_message, json.dumps(report.metadata)
+                report.end_time, report.error_message, _dump_metadata(report.metadata)
             ))
 
     def get_findings_by_severity(self, severity: Severity) -> List[SecurityFinding]:
@@ -752,17 +919,21 @@ class SecurityDatabase:
                        cvss_score, status, created_at, resolved_at, metadata
                 FROM security_findings WHERE severity = ?
             ''', (severity.value,))
-            rows = cursor.fetchall()
-            findings = []
-            for row in rows:
-                findings.append(SecurityFinding(
-                    id=row[0], scan_type=ScanType(row[1]), target=row[2],
-                    severity=Severity(row[3]), title=row[4], description=row[5],
-                    recommendation=row[6], cvss_score=row[7], status=row[8],
-                    created_at=row[9], resolved_at=row[10],
-                    metadata=json.loads(row[11]) if row[11] else {}
-                ))
-            return findings
+            return [SecurityFinding.from_row(row) for row in cursor]
+
+    def count_by_severity(self) -> Dict[str, int]:
+        """Count findings per severity level."""
+        with self.get_connection() as conn:
+            return dict(conn.execute(
+                'SELECT severity, COUNT(*) FROM security_findings GROUP BY severity'
+            ).fetchall())
+
+    def count_by_scan_type(self) -> Dict[str, int]:
+        """Count findings per scan type."""
+        with self.get_connection() as conn:
+            return dict(conn.execute(
+                'SELECT scan_type, COUNT(*) FROM security_findings GROUP BY scan_type'
+            ).fetchall())
 
     def get_all_findings(self) -> List[SecurityFinding]:
         """Get all security findings."""
@@ -772,17 +943,7 @@ class SecurityDatabase:
                        cvss_score, status, created_at, resolved_at, metadata
                 FROM security_findings
             ''')
-            rows = cursor.fetchall()
-            findings = []
-            for row in rows:
-                findings.append(SecurityFinding(
-                    id=row[0], scan_type=ScanType(row[1]), target=row[2],
-                    severity=Severity(row[3]), title=row[4], description=row[5],
-                    recommendation=row[6], cvss_score=row[7], status=row[8],
-                    created_at=row[9], resolved_at=row[10],
-                    metadata=json.loads(row[11]) if row[11] else {}
-                ))
-            return findings
+            return [SecurityFinding.from_row(row) for row in cursor]
 
 
 class SecurityScanner:
@@ -791,33 +952,47 @@ class SecurityScanner:
     def __init__(self, config_path: str = None):
         self.config_path = config_path
         self.logger = self.setup_logger()
-        self.security_db = SecurityDatabase(os.getenv('SECURITY_SCANNER_DATABASE_PATH', ':memory:'))
-        self.asset_discoverer = AssetDiscoverer({})
-        self.vuln_scanner = VulnerabilityScanner({})
-        self.config_auditor = ConfigurationAuditor({})
-        self.compliance_checker = ComplianceChecker({})
-        self.threat_detector = ThreatDetector({})
 
         # Load configuration
         self.config = self.load_config()
 
-        # Reinitialize components with loaded config
+        # Scan types default to enabled, so only the explicit opt-outs are tracked
+        self._disabled_scans = {
+            scan_type for scan_type, scan_config in self.config.get('scan_types', {}).items()
+            if not scan_config.get('enabled', True)
+        }
+
+        self.security_db = SecurityDatabase(os.getenv('SECURITY_SCANNER_DATABASE_PATH', ':memory:'))
+
+        # Initialize components with loaded config
         self.asset_discoverer = AssetDiscoverer(self.config)
-        self.vuln_scanner = VulnerabilityScanner(self.config)
+        self.vuln_scanner = VulnerabilityScanner(self.config, self.asset_discoverer)
         self.config_auditor = ConfigurationAuditor(self.config)
-        self.compliance_checker = ComplianceChecker(self.config)
+        self.compliance_checker = ComplianceChecker(self.config, self.asset_discoverer)
         self.threat_detector = ThreatDetector(self.config)
 
+        # scan type -> (scanner, report scan type, enabled key or None if always enabled)
+        self._scan_dispatch = {
+            'vulnerability': (self.vuln_scanner.scan_for_vulnerabilities, ScanType.VULNERABILITY, 'vulnerability'),
+            'configuration': (self.config_auditor.audit_configurations, ScanType.CONFIGURATION, 'configuration'),
+            'compliance': (self._check_compliance_findings, ScanType.COMPLIANCE, 'compliance'),
+            'threat': (self.threat_detector.detect_threats, ScanType.NETWORK, None),
+            'asset': (self._discover_assets, ScanType.ASSET, None)
+        }
+
     def setup_logger(self) -> logging.Logger:
         """Setup logging for the security scanner."""
         logger = logging.getLogger('SecurityScanner')
-        logger.setLevel(getattr(logging, os.getenv('SECURITY_SCANNER_LOG_LEVEL', 'INFO')))
+        logger.setLevel(_LOG_LEVELS.get(os.getenv('SECURITY_SCANNER_LOG_LEVEL', 'INFO').upper(), logging.INFO))
 
         # Create file handler
         log_file = os.getenv('SECURITY_SCANNER_LOG_FILE_PATH', '/tmp/security_scanner.log')
-        handler = logging.FileHandler(log_file)
+        file_handler = logging.FileHandler(log_file)
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
+        file_handler.setFormatter(formatter)
+
+        # Buffer records so scan loops don't issue a write() per message; errors flush immediately
+        handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
 
         logger.addHandler(handler)
         return logger
@@ -854,64 +1029,47 @@ class SecurityScanner:
 
     def run_scan(self, scan_type: str, target: str = "system") -> Dict[str, Any]:
         """Run a security scan of the specified type on the target."""
-        scan_id = f"scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{hash(scan_type + target) % 10000}"
-        start_time = datetime.now().isoformat()
+        start_dt = datetime.now()
+        start_time = start_dt.isoformat()
+        scan_id = f"scan_{start_dt:%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
 
         try:
-            all_findings = []
-
-            # Perform the appropriate scan based on type
-            if scan_type.upper() == "VULNERABILITY":
-                if self.config.get('scan_types', {}).get('vulnerability', {}).get('enabled', True):
-                    findings = self.vuln_scanner.scan_for_vulnerabilities(target)
-                    all_findings.extend(findings)
-
-            elif scan_type.upper() == "CONFIGURATION":
-                if self.config.get('scan_types', {}).get('configuration', {}).get('enabled', True):
-                    findings = self.config_auditor.audit_configurations(target)
-                    all_findings.extend(findings)
-
-            elif scan_type.upper() == "COMPLIANCE":
-                if self.config.get('scan_types', {}).get('compliance', {}).get('enabled', True):
-                    compliance_result = self.compliance_checker.check_compliance(target, target)
-                    for finding in compliance_result.get('findings', []):
-                        all_findings.append(finding)
-
-            elif scan_type.upper() == "THREAT":
-                findings = self.threat_detector.detect_threats(target)
-                all_findings.extend(findings)
+            _, report_scan_type, _ = self._get_scan_entry(scan_type)
+        except ValueError as e:
+            self.logger.error(f"Error during security scan: {e}")
+            return {
+                "status": "error",
+                "scan_id": scan_id,
+                "error": str(e)
+            }
 
-            elif scan_type.upper() == "ASSET":
-                assets = self.asset_discoverer.discover_system_assets()
-                # For now, just log assets discovered, could create findings for missing security measures
-                self.logger.info(f"Assets discovered: {len(assets)} categories")
+        try:
+            all_findings = self._execute_scan(scan_type, target)
 
-            else:
-                raise ValueError(f"Unsupported scan type: {scan_type}")
+            # Asset discovery never yields findings, so there is nothing to report
+            if report_scan_type is ScanType.ASSET and not all_findings:
+                return {
+                    "status": "success",
+                    "scan_id": scan_id,
+                    "findings_count": 0
+                }
 
             # Add findings to database
-            for finding in all_findings:
-                self.security_db.add_finding(finding)
+            self.security_db.add_findings_bulk(all_findings)
 
             # Create scan report
-            critical_count = sum(1 for f in all_findings if f.severity == Severity.CRITICAL)
-            high_count = sum(1 for f in all_findings if f.severity == Severity.HIGH)
-            medium_count = sum(1 for f in all_findings if f.severity == Severity.MEDIUM)
-            low_count = sum(1 for f in all_findings if f.severity == Severity.LOW)
+            counts = self._count_severities(all_findings)
 
             report = ScanReport(
                 id=scan_id,
-                scan_type=ScanType(scan_type.lower()),
+                scan_type=report_scan_type,
                 target=target,
                 status="completed",
                 total_findings=len(all_findings),
-                critical_findings=critical_count,
-                high_findings=high_count,
-                medium_findings=medium_count,
-                low_findings=low_count,
                 start_time=start_time,
                 end_time=datetime.now().isoformat(),
-                metadata={"scan_type_specific": scan_type}
+                metadata={"scan_type_specific": scan_type},
+                **counts
             )
 
             self.security_db.add_scan_report(report)
@@ -922,10 +1080,7 @@ class SecurityScanner:
                 "status": "success",
                 "scan_id": scan_id,
                 "findings_count": len(all_findings),
-                "critical_findings": critical_count,
-                "high_findings": high_count,
-                "medium_findings": medium_count,
-                "low_findings": low_count
+                **counts
             }
 
         except Exception as e:
@@ -934,7 +1089,7 @@ class SecurityScanner:
             # Create failed scan report
             report = ScanReport(
                 id=scan_id,
-                scan_type=ScanType(scan_type.lower()),
+                scan_type=report_scan_type,
                 target=target,
                 status="failed",
                 total_findings=0,
@@ -956,57 +1111,158 @@ class SecurityScanner:
                 "error": str(e)
             }
 
+    def _execute_scan(self, scan_type: str, target: str) -> List[SecurityFinding]:
+        """Run the scanner for a scan type and return its findings without persisting them."""
+        scanner, _, enabled_key = self._get_scan_entry(scan_type)
+        if enabled_key and enabled_key in self._disabled_scans:
+            return []
+        return scanner(target)
+
+    def _get_scan_entry(self, scan_type: str) -> Tuple:
+        """Look up the (scanner, report scan type, enabled key) entry for a scan type."""
+        entry = self._scan_dispatch.get(scan_type.lower())
+        if entry is None:
+            raise ValueError(f"Unsupported scan type: {scan_type}")
+        return entry
+
+    def _check_compliance_findings(self, target: str) -> List[SecurityFinding]:
+        """Run the compliance check for a target and return only its findings."""
+        compliance_result = self.compliance_checker.check_compliance(target, target)
+        return compliance_result.get('findings', [])
+
+    def _discover_assets(self, target: str) -> List[SecurityFinding]:
+        """Run asset discovery; it does not produce findings yet."""
+        assets = self.asset_discoverer.discover_system_assets()
+        # For now, just log assets discovered, could create findings for missing security measures
+        self.logger.info(f"Assets discovered: {len(assets)} categories")
+        return []
+
+    @staticmethod
+    def _count_severities(findings: List[SecurityFinding]) -> Dict[str, int]:
+        """Count findings per severity, keyed like the ScanReport count fields."""
+        # Enum hashing runs in Python, so Counter is slow on large scans; list.count
+        # matches by identity in C and keeps all four passes out of the interpreter
+        severities = list(map(_get_severity, findings))
+        return {
+            "critical_findings": severities.count(Severity.CRITICAL),
+            "high_findings": severities.count(Severity.HIGH),
+            "medium_findings": severities.count(Severity.MEDIUM),
+            "low_findings": severities.count(Severity.LOW)
+        }
+
     def run_comprehensive_scan(self, target: str = "system") -> Dict[str, Any]:
         """Run all available scan types on the target."""
+        start_dt = datetime.now()
+        start_time = start_dt.isoformat()
+        scan_id = f"scan_{start_dt:%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
         results = {}
+        errors = {}
+        all_findings = []
 
         scan_types = ["vulnerability", "configuration", "threat"]
 
-        for scan_type in scan_types:
-            if self.config.get('scan_types', {}).get(scan_type, {}).get('enabled', True):
+        enabled_scan_types = [
+            scan_type for scan_type in scan_types
+            if scan_type not in self._disabled_scans
+        ]
+
+        if not enabled_scan_types:
+            self.logger.info(f"Comprehensive scan {scan_id} skipped: all scan types are disabled")
+            return {
+                "status": "completed",
+                "scan_id": scan_id,
+                "scan_types_run": [],
+                "results": {},
+                "summary": {
+                    "total_findings": 0,
+                    "critical_findings": 0,
+                    "high_findings": 0
+                }
+            }
+
+        # The scans are independent and mostly wait on subprocesses and the filesystem
+        max_workers = self.config.get('scanning', {}).get('max_concurrent_scans', 5)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for scan_type in enabled_scan_types:
                 self.logger.info(f"Running {scan_type} scan on {target}")
-                result = self.run_scan(scan_type, target)
-                results[scan_type] = result
+                futures[scan_type] = executor.submit(self._execute_scan, scan_type, target)
 
-        # Get overall results
-        total_findings = sum(r.get('findings_count', 0) for r in results.values() if 'findings_count' in r)
-        critical_findings = sum(r.get('critical_findings', 0) for r in results.values() if 'critical_findings' in r)
-        high_findings = sum(r.get('high_findings', 0) for r in results.values() if 'high_findings' in r)
+            for scan_type in enabled_scan_types:
+                try:
+                    findings = futures[scan_type].result()
+                except Exception as e:
+                    self.logger.error(f"Error during {scan_type} scan: {e}")
+                    errors[scan_type] = str(e)
+                    results[scan_type] = {"status": "error", "scan_id": scan_id, "error": str(e)}
+                    continue
+
+                all_findings.extend(findings)
+                results[scan_type] = {
+                    "status": "success",
+                    "scan_id": scan_id,
+                    "findings_count": len(findings),
+                    **self._count_severities(findings)
+                }
+
+        # Persist every scan type's findings and one combined report in two writes
+        self.security_db.add_findings_bulk(all_findings)
+
+        if not errors:
+            status = "completed"
+        elif len(errors) == len(results):
+            status = "failed"
+        else:
+            status = "partial"
+
+        counts = self._count_severities(all_findings)
+        report = ScanReport(
+            id=scan_id,
+            scan_type=ScanType.COMPREHENSIVE,
+            target=target,
+            status=status,
+            total_findings=len(all_findings),
+            start_time=start_time,
+            end_time=datetime.now().isoformat(),
+            error_message="; ".join(f"{st}: {err}" for st, err in errors.items()) or None,
+            metadata={"scan_types_run": list(results.keys())},
+            **counts
+        )
+        self.security_db.add_scan_report(report)
+
+        self.logger.info(f"Comprehensive scan {scan_id} {status} with {len(all_findings)} findings")
 
         return {
-            "status": "completed",
+            "status": status,
+            "scan_id": scan_id,
             "scan_types_run": list(results.keys()),
             "results": results,
             "summary": {
-                "total_findings": total_findings,
-                "critical_findings": critical_findings,
-                "high_findings": high_findings
+                "total_findings": len(all_findings),
+                "critical_findings": counts["critical_findings"],
+                "high_findings": counts["high_findings"]
             }
         }
 
     def get_security_status(self) -> Dict[str, Any]:
         """Get the overall security status."""
-        all_findings = self.security_db.get_all_findings()
-
-        critical_findings = [f for f in all_findings if f.severity == Severity.CRITICAL]
-        high_findings = [f for f in all_findings if f.severity == Severity.HIGH]
-        medium_findings = [f for f in all_findings if f.severity == Severity.MEDIUM]
-        low_findings = [f for f in all_findings if f.severity == Severity.LOW]
+        severity_counts = self.security_db.count_by_severity()
+        category_counts = self.security_db.count_by_scan_type()
 
         # Get latest scan reports
         # This would require a method to retrieve scan reports from DB
 
         return {
-            "total_findings": len(all_findings),
-            "critical_findings": len(critical_findings),
-            "high_findings": len(high_findings),
-            "medium_findings": len(medium_findings),
-            "low_findings": len(low_findings),
+            "total_findings": sum(severity_counts.values()),
+            "critical_findings": severity_counts.get(Severity.CRITICAL.value, 0),
+            "high_findings": severity_counts.get(Severity.HIGH.value, 0),
+            "medium_findings": severity_counts.get(Severity.MEDIUM.value, 0),
+            "low_findings": severity_counts.get(Severity.LOW.value, 0),
             "findings_by_category": {
-                "vulnerability": len([f for f in all_findings if f.scan_type == ScanType.VULNERABILITY]),
-                "configuration": len([f for f in all_findings if f.scan_type == ScanType.CONFIGURATION]),
-                "compliance": len([f for f in all_findings if f.scan_type == ScanType.COMPLIANCE]),
-                "network": len([f for f in all_findings if f.scan_type == ScanType.NETWORK])
+                "vulnerability": category_counts.get(ScanType.VULNERABILITY.value, 0),
+                "configuration": category_counts.get(ScanType.CONFIGURATION.value, 0),
+                "compliance": category_counts.get(ScanType.COMPLIANCE.value, 0),
+                "network": category_counts.get(ScanType.NETWORK.value, 0)
             }
         }
 
@@ -1016,8 +1272,7 @@ class SecurityScanner:
             result = self.compliance_checker.check_compliance(standard, target)
 
             # Add compliance findings to DB
-            for finding in result.get('findings', []):
-                self.security_db.add_finding(finding)
+            self.security_db.add_findings_bulk(result.get('findings', []))
 
             return result
         except Exception as e:
@@ -5,18 +5,124 @@ Social Media Post Scheduler for Social Media Poster Skill
 
 import asyncio
 import aiohttp
-import json
 import os
+import random
 import logging
+import logging.handlers
 import sqlite3
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import hashlib
-from pathlib import Path
-import schedule
-import time
+import json
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Statements are kept as module constants so the connection's statement cache
+# always sees the identical SQL text and skips re-preparing it
+SQL_INSERT_POST = '''
+    INSERT INTO scheduled_posts (platform, content, scheduled_time)
+    VALUES (?, ?, ?)
+'''
+# The inner id-only SELECT is answered from idx_posts_status_time without touching
+# table rows; only the claimed rows are read, and only the columns posting needs
+SQL_CLAIM_READY = '''
+    UPDATE scheduled_posts
+    SET status = 'posting', updated_at = ?
+    WHERE id IN (
+        SELECT id FROM scheduled_posts
+        WHERE status = 'scheduled' AND scheduled_time <= ?
+        ORDER BY scheduled_time ASC
+        LIMIT ?
+    )
+    RETURNING id, platform, content
+'''
+SQL_CLAIM_POST = "UPDATE scheduled_posts SET status = 'posting', updated_at = ? WHERE id = ? AND status = 'scheduled'"
+SQL_UPDATE_STATUS = 'UPDATE scheduled_posts SET status = ?, updated_at = ? WHERE id = ?'
+SQL_CANCEL = '''
+    UPDATE scheduled_posts
+    SET status = 'cancelled', updated_at = ?
+    WHERE id = ? AND status = 'scheduled'
+'''
+SQL_STATS_ALL = 'SELECT status, COUNT(*) FROM scheduled_posts GROUP BY status'
+SQL_STATS_PLATFORM = 'SELECT status, COUNT(*) FROM scheduled_posts WHERE platform = ? GROUP BY status'
+SQL_NEXT_DUE = "SELECT MIN(scheduled_time) FROM scheduled_posts WHERE status = 'scheduled'"
+
+
+# Maximum number of ready posts claimed per scheduler tick
+CLAIM_BATCH_SIZE = 100
+
+# Longest the scheduler waits between ticks while posts are pending
+SCHEDULER_INTERVAL = 60
+
+# Shortest wait between ticks, and the wait when nothing is scheduled at all
+MIN_SCHEDULER_SLEEP = 1
+MAX_IDLE_SLEEP = 300
+
+# Seconds between PRAGMA optimize runs while the scheduler loop is running
+OPTIMIZE_INTERVAL = 6 * 60 * 60
+
+# Concurrent in-flight API requests allowed per platform
+PLATFORM_CONCURRENCY = {
+    'linkedin': 8,
+    'twitter': 8,
+    'facebook': 8,
+    'instagram': 8
+}
+
+# Retries for rate-limited (429) or server-error (5xx) API responses
+MAX_RETRIES = 3
+
+# Bytes of an error response body kept for logging
+ERROR_BODY_LIMIT = 4096
+
+
+def _loads_json(raw: bytes) -> Any:
+    """Decode a JSON response body, mapping an empty body to None"""
+    if not raw:
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_payload(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Request keyword arguments sending data as a JSON body, pre-serialized with orjson if available"""
+    if ORJSON_AVAILABLE:
+        # The caller's headers must set Content-Type: application/json
+        return {'data': orjson.dumps(data)}
+    return {'json': data}
+
+
+@lru_cache(maxsize=4096)
+def _media_urn(media_path: str) -> str:
+    """Derive a stable LinkedIn image URN for a media path"""
+    return f"urn:li:image:{hashlib.blake2b(media_path.encode(), digest_size=16).hexdigest()}"
+
+
+def _media_urns(media_paths: List[str]) -> List[str]:
+    """Return LinkedIn image URNs for the media files that exist on disk (blocking)"""
+    # In a real implementation, we would upload media first
+    # This is a simplified version
+    return [_media_urn(media_path) for media_path in media_paths if os.path.exists(media_path)]
+
 
 class SocialMediaScheduler:
+    # Fixed attribute layout: no per-instance __dict__ and faster attribute access
+    __slots__ = (
+        'linkedin_token', 'twitter_token', 'facebook_token', 'instagram_token',
+        'db_path', 'platform_configs',
+        '_session', '_session_loop', '_rate_limiters', '_background_tasks',
+        '_wake_event', '_scheduler_loop', '_instagram_account_id', '_instagram_account_lock',
+        '_conn', '_db_lock', '_dispatch', '_linkedin_post_template'
+    )
+
     def __init__(self):
         """Initialize the Social Media Scheduler with configuration"""
         # API tokens from environment variables
@@ -26,25 +132,66 @@ class SocialMediaScheduler:
         self.instagram_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
 
         # Setup logging
-        logging.basicConfig(
-            filename=f'/Logs/social_media_scheduler_{datetime.now().strftime("%Y%m%d")}.log',
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s'
-        )
-
-        # Database for tracking posts
+        self._configure_logging()
+
+        # Shared HTTP session, created lazily inside the running event loop
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._rate_limiters: Dict[str, asyncio.Semaphore] = {}
+        self._background_tasks = set()
+        # Instagram account linked to Facebook, looked up on the first Instagram post
+        self._instagram_account_id: Optional[str] = None
+        self._instagram_account_lock: Optional[asyncio.Lock] = None
+        # Set by schedule_post to wake a sleeping run_scheduler_loop early
+        self._wake_event: Optional[asyncio.Event] = None
+        self._scheduler_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Database for tracking posts, kept open for the scheduler's lifetime
         self.db_path = '/Data/social_media_posts.db'
+        self._db_lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        # Only takes effect when the database is first created, before any table exists
+        self._conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA wal_autocheckpoint=1000')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-20000')
         self._setup_database()
 
-        # Platform configurations
+        # Constant fields of every LinkedIn post, shared read-only between posts
+        self._linkedin_post_template = {
+            "author": f"urn:li:person:{os.getenv('LINKEDIN_PERSON_URN')}",
+            "lifecycleState": "PUBLISHED",
+            "visibility": {
+                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
+            }
+        }
+
+        # Platform name -> posting coroutine
+        self._dispatch = {
+            'linkedin': self._post_linkedin,
+            'twitter': self._post_twitter,
+            'facebook': self._post_facebook,
+            'instagram': self._post_instagram
+        }
+
+        # Platform configurations; the headers are built once and sent as-is with every request
         self.platform_configs = {
             'linkedin': {
                 'api_url': 'https://api.linkedin.com/v2/ugcPosts',
-                'headers': {'Authorization': f'Bearer {self.linkedin_token}'}
+                'headers': {
+                    'Authorization': f'Bearer {self.linkedin_token}',
+                    'Content-Type': 'application/json',
+                    'X-Restli-Protocol-Version': '2.0.0'
+                }
             },
             'twitter': {
                 'api_url': 'https://api.twitter.com/2/tweets',
-                'headers': {'Authorization': f'Bearer {self.twitter_token}'}
+                'headers': {
+                    'Authorization': f'Bearer {self.twitter_token}',
+                    'Content-Type': 'application/json'
+                }
             },
             'facebook': {
                 'api_url': f'https://graph.facebook.com/me/feed',
@@ -56,37 +203,183 @@ class SocialMediaScheduler:
             }
         }
 
+    def _configure_logging(self):
+        """Log to a file that rolls over at midnight instead of one named after the start date"""
+        # basicConfig ignores handlers once the root logger is configured, so only
+        # open the log file for the first scheduler instance
+        if logging.getLogger().handlers:
+            return
+        handler = logging.handlers.TimedRotatingFileHandler(
+            '/Logs/social_media_scheduler.log',
+            when='midnight'
+        )
+        logging.basicConfig(
+            handlers=[handler],
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s'
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        # A session is bound to the loop it was created in (asyncio.run makes a fresh one)
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            if self._session is not None and not self._session.closed:
+                await self._close_stale_session(self._session, self._session_loop)
+            connector = aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                keepalive_timeout=75,
+                ttl_dns_cache=300
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._session_loop = loop
+            # Semaphores belong to a loop too, so they are recreated alongside the session
+            self._rate_limiters = {
+                platform: asyncio.Semaphore(limit) for platform, limit in PLATFORM_CONCURRENCY.items()
+            }
+            self._instagram_account_lock = asyncio.Lock()
+        return self._session
+
+    async def _close_stale_session(self, session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop):
+        """Close a session that belongs to another event loop"""
+        if loop.is_running():
+            # Its connections can only be closed from their own loop
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+
+        try:
+            await session.close()
+        except RuntimeError as e:
+            # The owning loop is already closed and cannot schedule the transport teardown
+            logging.debug(f"Could not close stale HTTP session: {str(e)}")
+
+    async def _send(self, platform: str, method: str, url: str, **kwargs) -> Tuple[int, Any]:
+        """
+        Send an API request under the platform's rate limit, retrying 429 and 5xx responses
+
+        POSTs are not idempotent, so they are only retried on 429 or a 503 carrying
+        Retry-After, where the server has said the request was not processed.
+
+        Returns:
+            Tuple of the final status code and the body: decoded JSON for 2xx responses,
+            otherwise up to ERROR_BODY_LIMIT bytes of text
+        """
+        session = await self._get_session()
+        limiter = self._rate_limiters[platform]
+
+        for attempt in range(MAX_RETRIES + 1):
+            async with limiter:
+                async with session.request(method, url, **kwargs) as response:
+                    status = response.status
+                    if 200 <= status < 300:
+                        return status, _loads_json(await response.read())
+
+                    # Error bodies are only logged, so read a bounded prefix
+                    body = (await response.content.read(ERROR_BODY_LIMIT)).decode('utf-8', 'replace')
+                    retry_after = response.headers.get('Retry-After')
+                    remaining = response.headers.get('X-RateLimit-Remaining')
+
+            if method == 'POST':
+                retryable = status == 429 or (status == 503 and retry_after is not None)
+            else:
+                retryable = status == 429 or status >= 500
+            if not retryable or attempt == MAX_RETRIES:
+                return status, body
+
+            # Prefer the server's Retry-After hint, otherwise back off exponentially with jitter
+            if retry_after is not None and retry_after.isdigit():
+                delay = float(retry_after)
+                if delay > SCHEDULER_INTERVAL:
+                    logging.warning("%s API returned %s with Retry-After %ss, giving up",
+                                    platform, status, retry_after)
+                    return status, body
+            else:
+                delay = 2 ** attempt + random.random()
+            logging.warning("%s API returned %s (remaining: %s), retrying in %.1fs",
+                            platform, status, remaining, delay)
+            await asyncio.sleep(delay)
+
+    async def close(self):
+        """Close the shared HTTP session (the database connection stays open)"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def shutdown(self):
+        """Close the HTTP session and run database maintenance; called once when the scheduler stops"""
+        await self.close()
+
+        # Reclaim free pages, refresh planner statistics that drifted while the
+        # scheduler ran and truncate the WAL file
+        await asyncio.to_thread(self._optimize)
+
+    def _optimize(self):
+        """Run database maintenance on the shared connection (blocking)"""
+        with self._transaction() as cursor:
+            # incremental_vacuum frees one page per step and execute() only steps once;
+            # executescript runs it to completion
+            cursor.executescript('PRAGMA incremental_vacuum(1000)')
+            cursor.execute('PRAGMA optimize')
+            cursor.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def _refresh_statistics(self):
+        """Let SQLite re-analyze tables whose planner statistics have drifted (blocking)"""
+        with self._transaction() as cursor:
+            cursor.execute('PRAGMA optimize')
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a cursor on the shared connection, committing on success"""
+        with self._db_lock:
+            cursor = self._conn.cursor()
+            try:
+                yield cursor
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
     def _setup_database(self):
         """Setup database for tracking scheduled posts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS scheduled_posts (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL,
-                content TEXT NOT NULL,
-                scheduled_time DATETIME NOT NULL,
-                status TEXT DEFAULT 'scheduled',  -- scheduled, posted, failed, cancelled
-                post_id TEXT,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS post_analytics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                post_id INTEGER,
-                platform TEXT,
-                metric_name TEXT,
-                metric_value REAL,
-                recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
+        with self._transaction() as cursor:
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS scheduled_posts (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    platform TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    scheduled_time DATETIME NOT NULL,
+                    status TEXT DEFAULT 'scheduled',  -- scheduled, posted, failed, cancelled
+                    post_id TEXT,
+                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS post_analytics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    post_id INTEGER,
+                    platform TEXT,
+                    metric_name TEXT,
+                    metric_value REAL,
+                    recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Serve the per-tick ready-post lookup and the stats grouping from indexes
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_posts_status_time
+                ON scheduled_posts(status, scheduled_time)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_posts_platform_status
+                ON scheduled_posts(platform, status)
+            ''')
 
-        conn.commit()
-        conn.close()
+            cursor.execute('ANALYZE')
 
     def schedule_post(self,
                      platform: str,
@@ -105,38 +398,138 @@ class SocialMediaScheduler:
         Returns:
             bool: True if scheduled successfully, False otherwise
         """
-        try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+        return bool(self.schedule_posts([(platform, content, scheduled_time)], media_attachments))
 
-            cursor.execute('''
-                INSERT INTO scheduled_posts (platform, content, scheduled_time)
-                VALUES (?, ?, ?)
-            ''', (platform, content, scheduled_time))
+    def schedule_posts(self,
+                       posts: List[Tuple[str, str, datetime]],
+                       media_attachments: List[str] = None) -> List[int]:
+        """
+        Schedule several posts in a single transaction
+
+        Args:
+            posts: (platform, content, scheduled_time) tuples
+            media_attachments: List of media file paths attached to every post
 
-            conn.commit()
-            post_id = cursor.lastrowid
-            conn.close()
+        Returns:
+            List[int]: IDs of the scheduled posts in input order, empty if scheduling failed
+        """
+        try:
+            # One commit for the whole batch; the insert's statement is reused from the cache
+            post_ids = []
+            with self._transaction() as cursor:
+                for post in posts:
+                    cursor.execute(SQL_INSERT_POST, post)
+                    post_ids.append(cursor.lastrowid)
+        except Exception as e:
+            logging.error(f"Failed to schedule post: {str(e)}")
+            return []
 
-            logging.info(f"Post scheduled for {platform} at {scheduled_time}: {content[:50]}...")
+        now = datetime.now()
+        due_posts = []
+        wake_scheduler = False
+        for post_id, (platform, content, scheduled_time) in zip(post_ids, posts):
+            logging.info("Post scheduled for %s at %s: %s...", platform, scheduled_time, content[:50])
 
             # If scheduled time is in the past, post immediately
-            if scheduled_time <= datetime.now():
-                asyncio.run(self._post_immediately(platform, content, media_attachments))
-
-            return True
+            if scheduled_time <= now:
+                due_posts.append((post_id, platform, content))
+            else:
+                wake_scheduler = True
 
+        # The rows are committed, so a failed immediate post must not hide their IDs
+        try:
+            if due_posts:
+                self._submit_immediate_posts(due_posts, media_attachments)
+            if wake_scheduler:
+                self._wake_scheduler()
         except Exception as e:
-            logging.error(f"Failed to schedule post: {str(e)}")
-            return False
+            logging.error(f"Failed to post immediately: {str(e)}")
+
+        return post_ids
+
+    def _wake_scheduler(self):
+        """Wake run_scheduler_loop so it re-plans its sleep around a new post"""
+        loop = self._scheduler_loop
+        if loop is None or loop.is_closed():
+            return
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
 
-    async def _post_immediately(self, platform: str, content: str, media_attachments: List[str] = None):
+        if running is loop:
+            self._wake_event.set()
+        else:
+            loop.call_soon_threadsafe(self._wake_event.set)
+
+    def _submit_immediate_posts(self, due_posts: List[Tuple[int, str, str]],
+                                media_attachments: List[str] = None):
+        """Post now on the scheduler loop, the running event loop or a throwaway one, in that order"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        scheduler_loop = self._scheduler_loop
+        if scheduler_loop is not None and scheduler_loop is not loop and not scheduler_loop.is_closed():
+            # The scheduler loop owns the shared session, so hand the posts over to it
+            for post_id, platform, content in due_posts:
+                future = asyncio.run_coroutine_threadsafe(
+                    self._post_immediately(post_id, platform, content, media_attachments), scheduler_loop
+                )
+                future.add_done_callback(self._log_immediate_post_error)
+            return
+
+        if loop is None:
+            # One throwaway loop and session for the whole batch
+            asyncio.run(self._post_immediately_standalone(due_posts, media_attachments))
+            return
+
+        for post_id, platform, content in due_posts:
+            task = loop.create_task(self._post_immediately(post_id, platform, content, media_attachments))
+            # The loop only keeps weak references to tasks
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+            task.add_done_callback(self._log_immediate_post_error)
+
+    @staticmethod
+    def _log_immediate_post_error(future):
+        """Log an immediate post that raised instead of finishing"""
+        if not future.cancelled() and future.exception() is not None:
+            logging.error(f"Immediate post failed: {str(future.exception())}")
+
+    async def _post_immediately_standalone(self, due_posts: List[Tuple[int, str, str]],
+                                           media_attachments: List[str] = None):
+        """Post immediately from synchronous code under a throwaway event loop"""
+        try:
+            results = await asyncio.gather(
+                *(self._post_immediately(post_id, platform, content, media_attachments)
+                  for post_id, platform, content in due_posts),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logging.error(f"Immediate post failed: {str(result)}")
+        finally:
+            # The loop ends with this call, so the session cannot outlive it
+            await self.close()
+
+    async def _post_immediately(self, post_id: int, platform: str, content: str,
+                                media_attachments: List[str] = None):
         """Post immediately to the specified platform"""
+        # Claim the row first so the scheduler loop does not publish it a second time
+        if not await asyncio.to_thread(self._claim_post, post_id):
+            return
+
         success = await self.post_to_platform(platform, content, media_attachments)
+
+        await asyncio.to_thread(self._finalize, [('posted' if success else 'failed', datetime.now(), post_id)])
+
         if success:
-            logging.info(f"Immediate post successful to {platform}")
+            logging.info("Immediate post successful to %s", platform)
         else:
-            logging.error(f"Immediate post failed to {platform}")
+            logging.error("Immediate post failed to %s", platform)
 
     async def post_to_platform(self, platform: str, content: str, media_attachments: List[str] = None) -> bool:
         """
@@ -151,23 +544,12 @@ class SocialMediaScheduler:
             bool: True if successful, False otherwise
         """
         try:
-            if platform not in self.platform_configs:
+            handler = self._dispatch.get(platform)
+            if handler is None:
                 logging.error(f"Unsupported platform: {platform}")
                 return False
 
-            config = self.platform_configs[platform]
-
-            if platform == 'linkedin':
-                return await self._post_linkedin(content, media_attachments)
-            elif platform == 'twitter':
-                return await self._post_twitter(content, media_attachments)
-            elif platform == 'facebook':
-                return await self._post_facebook(content, media_attachments)
-            elif platform == 'instagram':
-                return await self._post_instagram(content, media_attachments)
-            else:
-                logging.error(f"Platform {platform} not implemented")
-                return False
+            return await handler(content, media_attachments)
 
         except Exception as e:
             logging.error(f"Error posting to {platform}: {str(e)}")
@@ -175,68 +557,52 @@ class SocialMediaScheduler:
 
     async def _post_linkedin(self, content: str, media_attachments: List[str]) -> bool:
         """Post to LinkedIn"""
-        headers = {
-            'Authorization': f'Bearer {self.linkedin_token}',
-            'Content-Type': 'application/json',
-            'X-Restli-Protocol-Version': '2.0.0'
-        }
+        headers = self.platform_configs['linkedin']['headers']
 
-        # Prepare the post data
-        post_data = {
-            "author": f"urn:li:person:{os.getenv('LINKEDIN_PERSON_URN')}",
-            "lifecycleState": "PUBLISHED",
-            "specificContent": {
-                "com.linkedin.ugc.ShareContent": {
-                    "shareCommentary": {
-                        "text": content
-                    },
-                    "shareMediaCategory": "NONE"
-                }
+        # Prepare the post data; only the share content varies between posts
+        share_content = {
+            "shareCommentary": {
+                "text": content
             },
-            "visibility": {
-                "com.linkedin.ugc.MemberNetworkVisibility": "PUBLIC"
-            }
+            "shareMediaCategory": "NONE"
         }
 
         if media_attachments:
             # Handle media upload for LinkedIn
-            media_values = []
-            for media_path in media_attachments:
-                if os.path.exists(media_path):
-                    # In a real implementation, we would upload media first
-                    # This is a simplified version
-                    media_values.append({
-                        "status": "READY",
-                        "media": f"urn:li:image:{hashlib.md5(media_path.encode()).hexdigest()}"
-                    })
-
-            post_data["specificContent"]["com.linkedin.ugc.ShareContent"]["shareMediaCategory"] = "IMAGE"
-            post_data["specificContent"]["com.linkedin.ugc.ShareContent"]["media"] = media_values
+            # Stat and hash the files in a worker thread so the event loop keeps serving other posts
+            media_urns = await asyncio.to_thread(_media_urns, media_attachments)
+            media_values = [{"status": "READY", "media": urn} for urn in media_urns]
+
+            share_content["shareMediaCategory"] = "IMAGE"
+            share_content["media"] = media_values
+
+        post_data = {
+            **self._linkedin_post_template,
+            "specificContent": {
+                "com.linkedin.ugc.ShareContent": share_content
+            }
+        }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://api.linkedin.com/v2/ugcPosts',
-                    headers=headers,
-                    json=post_data
-                ) as response:
-                    if response.status in [200, 201]:
-                        result = await response.json()
-                        logging.info(f"LinkedIn post successful: {result.get('id', 'unknown')}")
-                        return True
-                    else:
-                        logging.error(f"LinkedIn post failed: {response.status}, {await response.text()}")
-                        return False
+            status, result = await self._send(
+                'linkedin', 'POST',
+                'https://api.linkedin.com/v2/ugcPosts',
+                headers=headers,
+                **_json_payload(post_data)
+            )
+            if status in [200, 201]:
+                logging.info("LinkedIn post successful: %s", result.get('id', 'unknown'))
+                return True
+            else:
+                logging.error("LinkedIn post failed: %s, %s", status, result)
+                return False
         except Exception as e:
             logging.error(f"Error posting to LinkedIn: {str(e)}")
             return False
 
     async def _post_twitter(self, content: str, media_attachments: List[str]) -> bool:
         """Post to Twitter"""
-        headers = {
-            'Authorization': f'Bearer {self.twitter_token}',
-            'Content-Type': 'application/json'
-        }
+        headers = self.platform_configs['twitter']['headers']
 
         post_data = {
             "text": content
@@ -249,28 +615,25 @@ class SocialMediaScheduler:
             pass
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    'https://api.twitter.com/2/tweets',
-                    headers=headers,
-                    json=post_data
-                ) as response:
-                    if response.status in [200, 201]:
-                        result = await response.json()
-                        logging.info(f"Twitter post successful: {result.get('data', {}).get('id', 'unknown')}")
-                        return True
-                    else:
-                        logging.error(f"Twitter post failed: {response.status}, {await response.text()}")
-                        return False
+            status, result = await self._send(
+                'twitter', 'POST',
+                'https://api.twitter.com/2/tweets',
+                headers=headers,
+                **_json_payload(post_data)
+            )
+            if status in [200, 201]:
+                logging.info("Twitter post successful: %s", result.get('data', {}).get('id', 'unknown'))
+                return True
+            else:
+                logging.error("Twitter post failed: %s, %s", status, result)
+                return False
         except Exception as e:
             logging.error(f"Error posting to Twitter: {str(e)}")
             return False
 
     async def _post_facebook(self, content: str, media_attachments: List[str]) -> bool:
         """Post to Facebook"""
-        headers = {
-            'Authorization': f'Bearer {self.facebook_token}'
-        }
+        headers = self.platform_configs['facebook']['headers']
 
         post_data = {
             'message': content
@@ -283,158 +646,179 @@ class SocialMediaScheduler:
             pass
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f'https://graph.facebook.com/me/feed',
-                    headers=headers,
-                    data=post_data
-                ) as response:
-                    if response.status in [200, 201]:
-                        result = await response.json()
-                        logging.info(f"Facebook post successful: {result.get('id', 'unknown')}")
-                        return True
-                    else:
-                        logging.error(f"Facebook post failed: {response.status}, {await response.text()}")
-                        return False
+            status, result = await self._send(
+                'facebook', 'POST',
+                f'https://graph.facebook.com/me/feed',
+                headers=headers,
+                data=post_data
+            )
+            if status in [200, 201]:
+                logging.info("Facebook post successful: %s", result.get('id', 'unknown'))
+                return True
+            else:
+                logging.error("Facebook post failed: %s, %s", status, result)
+                return False
         except Exception as e:
             logging.error(f"Error posting to Facebook: {str(e)}")
             return False
 
+    async def _get_instagram_account_id(self) -> Optional[str]:
+        """Return the Instagram account linked to Facebook, looking it up only once"""
+        if self._instagram_account_id is not None:
+            return self._instagram_account_id
+
+        await self._get_session()
+        # Concurrent first posts wait for one lookup instead of each issuing their own
+        async with self._instagram_account_lock:
+            if self._instagram_account_id is not None:
+                return self._instagram_account_id
+
+            # Get user's Instagram account
+            status, accounts = await self._send(
+                'instagram', 'GET',
+                f'https://graph.facebook.com/v17.0/me/accounts',
+                headers=self.platform_configs['instagram']['headers']
+            )
+            if status != 200:
+                logging.error("Could not get Instagram account: %s", accounts)
+                return None
+
+            for account in accounts.get('data', []):
+                if 'instagram' in account.get('name', '').lower():
+                    self._instagram_account_id = account['id']
+                    return self._instagram_account_id
+
+            logging.error("No Instagram account found linked to Facebook")
+            return None
+
     async def _post_instagram(self, content: str, media_attachments: List[str]) -> bool:
         """Post to Instagram"""
-        headers = {
-            'Authorization': f'Bearer {self.instagram_token}'
-        }
+        headers = self.platform_configs['instagram']['headers']
 
         # Get Instagram account ID first
         try:
-            async with aiohttp.ClientSession() as session:
-                # Get user's Instagram account
-                async with session.get(
-                    f'https://graph.facebook.com/v17.0/me/accounts',
-                    headers={'Authorization': f'Bearer {self.instagram_token}'}
-                ) as response:
-                    if response.status != 200:
-                        logging.error(f"Could not get Instagram account: {await response.text()}")
-                        return False
-
-                    accounts = await response.json()
-                    instagram_account_id = None
-
-                    for account in accounts.get('data', []):
-                        if 'instagram' in account.get('name', '').lower():
-                            instagram_account_id = account['id']
-                            break
-
-                    if not instagram_account_id:
-                        logging.error("No Instagram account found linked to Facebook")
-                        return False
-
-                # Create media container
-                media_data = {
-                    'caption': content,
-                    'access_token': self.instagram_token
-                }
+            instagram_account_id = await self._get_instagram_account_id()
+            if not instagram_account_id:
+                return False
+
+            # Create media container
+            media_data = {
+                'caption': content,
+                'access_token': self.instagram_token
+            }
+
+            status, container_result = await self._send(
+                'instagram', 'POST',
+                f'https://graph.facebook.com/v17.0/{instagram_account_id}/media',
+                headers=headers,
+                data=media_data
+            )
+            if status != 200:
+                logging.error("Failed to create Instagram media container: %s", container_result)
+                return False
+
+            container_id = container_result.get('id')
+
+            # Publish the media
+            publish_data = {
+                'creation_id': container_id,
+                'access_token': self.instagram_token
+            }
 
-                async with session.post(
-                    f'https://graph.facebook.com/v17.0/{instagram_account_id}/media',
-                    headers=headers,
-                    data=media_data
-                ) as create_response:
-                    if create_response.status != 200:
-                        logging.error(f"Failed to create Instagram media container: {await create_response.text()}")
-                        return False
-
-                    container_result = await create_response.json()
-                    container_id = container_result.get('id')
-
-                    # Publish the media
-                    publish_data = {
-                        'creation_id': container_id,
-                        'access_token': self.instagram_token
-                    }
-
-                    async with session.post(
-                        f'https://graph.facebook.com/v17.0/{instagram_account_id}/media_publish',
-                        headers=headers,
-                        data=publish_data
-                    ) as publish_response:
-                        if publish_response.status in [200, 201]:
-                            result = await publish_response.json()
-                            logging.info(f"Instagram post successful: {result.get('id', 'unknown')}")
-                            return True
-                        else:
-                            logging.error(f"Instagram publish failed: {publish_response.status}, {await publish_response.text()}")
-                            return False
+            status, result = await self._send(
+                'instagram', 'POST',
+                f'https://graph.facebook.com/v17.0/{instagram_account_id}/media_publish',
+                headers=headers,
+                data=publish_data
+            )
+            if status in [200, 201]:
+                logging.info("Instagram post successful: %s", result.get('id', 'unknown'))
+                return True
+            else:
+                logging.error("Instagram publish failed: %s, %s", status, result)
+                return False
         except Exception as e:
             logging.error(f"Error posting to Instagram: {str(e)}")
             return False
 
     async def check_and_post_scheduled(self):
         """Check for scheduled posts that are ready to be posted"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get posts that are scheduled and ready to be posted
-        now = datetime.now()
-        cursor.execute('''
-            SELECT id, platform, content, scheduled_time
-            FROM scheduled_posts
-            WHERE status = 'scheduled' AND scheduled_time <= ?
-            ORDER BY scheduled_time ASC
-        ''', (now,))
-
-        ready_posts = cursor.fetchall()
-        conn.close()
+        # Atomically claim ready posts as 'posting' so no other worker picks them up;
+        # database work runs in a worker thread so disk I/O never blocks the event loop
+        ready_posts = await asyncio.to_thread(self._claim_ready, datetime.now())
 
-        logging.info(f"Found {len(ready_posts)} posts ready for publishing")
+        logging.info("Found %d posts ready for publishing", len(ready_posts))
 
-        for post_row in ready_posts:
-            post_id, platform, content, scheduled_time = post_row
+        # Post concurrently; per-platform API limits are enforced in _send
+        overall_limit = asyncio.Semaphore(32)
 
-            # Update status to 'posting' to prevent duplicate processing
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('UPDATE scheduled_posts SET status = ? WHERE id = ?', ('posting', post_id))
-            conn.commit()
-            conn.close()
+        results = await asyncio.gather(
+            *(self._process_scheduled_post(post_row, overall_limit) for post_row in ready_posts),
+            return_exceptions=True
+        )
 
-            # Post to the platform
+        # One timestamp for the whole batch: every post finished by the time gather returned
+        finished_at = datetime.now()
+        final_statuses = []
+        for post_row, result in zip(ready_posts, results):
+            if isinstance(result, Exception):
+                logging.error(f"Error processing scheduled post {post_row[0]}: {str(result)}")
+                result = 'failed'
+            final_statuses.append((result, finished_at, post_row[0]))
+
+        # Record every outcome in one transaction
+        await asyncio.to_thread(self._finalize, final_statuses)
+
+    def _claim_ready(self, now: datetime) -> List[tuple]:
+        """Mark up to CLAIM_BATCH_SIZE due posts as 'posting' and return them (blocking)"""
+        with self._transaction() as cursor:
+            cursor.execute(SQL_CLAIM_READY, (now, now, CLAIM_BATCH_SIZE))
+            return cursor.fetchall()
+
+    def _claim_post(self, post_id: int) -> bool:
+        """Mark one scheduled post as 'posting', returning False if it was already taken (blocking)"""
+        with self._transaction() as cursor:
+            cursor.execute(SQL_CLAIM_POST, (datetime.now(), post_id))
+            return cursor.rowcount > 0
+
+    def _next_due_time(self) -> Optional[datetime]:
+        """Return when the earliest pending post is due, or None if nothing is scheduled (blocking)"""
+        with self._transaction() as cursor:
+            cursor.execute(SQL_NEXT_DUE)
+            next_due = cursor.fetchone()[0]
+        return datetime.fromisoformat(next_due) if next_due else None
+
+    def _finalize(self, final_statuses: List[tuple]):
+        """Write (status, updated_at, id) outcomes in one transaction (blocking)"""
+        with self._transaction() as cursor:
+            cursor.executemany(SQL_UPDATE_STATUS, final_statuses)
+
+    async def _process_scheduled_post(self, post_row, overall_limit: asyncio.Semaphore) -> str:
+        """Publish one claimed scheduled post and return its final status"""
+        post_id, platform, content = post_row
+
+        # Post to the platform
+        async with overall_limit:
             success = await self.post_to_platform(platform, content)
 
-            # Update status based on result
-            final_status = 'posted' if success else 'failed'
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            cursor.execute('UPDATE scheduled_posts SET status = ?, updated_at = ? WHERE id = ?',
-                          (final_status, datetime.now(), post_id))
-            conn.commit()
-            conn.close()
-
-            if success:
-                logging.info(f"Successfully posted scheduled post {post_id} to {platform}")
-            else:
-                logging.error(f"Failed to post scheduled post {post_id} to {platform}")
+        if success:
+            logging.info("Successfully posted scheduled post %s to %s", post_id, platform)
+        else:
+            logging.error("Failed to post scheduled post %s to %s", post_id, platform)
+
+        return 'posted' if success else 'failed'
 
     def cancel_scheduled_post(self, post_id: int) -> bool:
         """Cancel a scheduled post"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            with self._transaction() as cursor:
+                cursor.execute(SQL_CANCEL, (datetime.now(), post_id))
+                cancelled = cursor.rowcount > 0
 
-            cursor.execute('''
-                UPDATE scheduled_posts
-                SET status = 'cancelled', updated_at = ?
-                WHERE id = ? AND status = 'scheduled'
-            ''', (datetime.now(), post_id))
-
-            if cursor.rowcount > 0:
-                conn.commit()
-                conn.close()
+            if cancelled:
                 logging.info(f"Cancelled scheduled post {post_id}")
                 return True
             else:
-                conn.close()
                 logging.warning(f"No scheduled post found with ID {post_id}")
                 return False
 
@@ -444,19 +828,15 @@ class SocialMediaScheduler:
 
     def get_post_stats(self, platform: str = None) -> Dict[str, int]:
         """Get statistics about posts"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        if platform:
-            cursor.execute('SELECT status, COUNT(*) FROM scheduled_posts WHERE platform = ? GROUP BY status', (platform,))
-        else:
-            cursor.execute('SELECT status, COUNT(*) FROM scheduled_posts GROUP BY status')
-
-        stats = {}
-        for row in cursor.fetchall():
-            stats[row[0]] = row[1]
+        with self._transaction() as cursor:
+            if platform:
+                cursor.execute(SQL_STATS_PLATFORM, (platform,))
+            else:
+                cursor.execute(SQL_STATS_ALL)
 
-        conn.close()
+            stats = {}
+            for row in cursor.fetchall():
+                stats[row[0]] = row[1]
 
         # Ensure all statuses are represented
         for status in ['scheduled', 'posted', 'failed', 'cancelled']:
@@ -469,16 +849,55 @@ class SocialMediaScheduler:
         """Run the scheduler loop continuously"""
         logging.info("Social Media Scheduler started")
 
-        while True:
-            try:
-                await self.check_and_post_scheduled()
-                await asyncio.sleep(60)  # Check every minute
-            except KeyboardInterrupt:
-                logging.info("Social Media Scheduler stopped")
-                break
-            except Exception as e:
-                logging.error(f"Error in scheduler loop: {str(e)}")
-                await asyncio.sleep(60)  # Wait before retrying
+        loop = asyncio.get_running_loop()
+        self._wake_event = asyncio.Event()
+        self._scheduler_loop = loop
+        next_optimize = loop.time() + OPTIMIZE_INTERVAL
+
+        try:
+            while True:
+                # Deadlines are measured on the monotonic clock from the tick start,
+                # so tick duration does not add drift
+                tick_started = loop.time()
+                try:
+                    await self.check_and_post_scheduled()
+                except KeyboardInterrupt:
+                    logging.info("Social Media Scheduler stopped")
+                    break
+                except Exception as e:
+                    logging.error(f"Error in scheduler loop: {str(e)}")
+
+                # Keep planner statistics current on a long-running connection
+                if loop.time() >= next_optimize:
+                    next_optimize = loop.time() + OPTIMIZE_INTERVAL
+                    try:
+                        await asyncio.to_thread(self._refresh_statistics)
+                    except Exception as e:
+                        logging.error(f"Error optimizing database: {str(e)}")
+
+                # Posts scheduled from here on wake the loop through the event
+                self._wake_event.clear()
+                try:
+                    next_due = await asyncio.to_thread(self._next_due_time)
+                except Exception as e:
+                    logging.error(f"Error finding next scheduled post: {str(e)}")
+                    next_due = datetime.now()
+
+                # Sleep until the next post is due, checking at least every
+                # SCHEDULER_INTERVAL while posts are pending
+                if next_due is None:
+                    wake_at = tick_started + MAX_IDLE_SLEEP
+                else:
+                    until_due = max(MIN_SCHEDULER_SLEEP, (next_due - datetime.now()).total_seconds())
+                    wake_at = min(tick_started + SCHEDULER_INTERVAL, loop.time() + until_due)
+
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=max(0, wake_at - loop.time()))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._scheduler_loop = None
+            await self.shutdown()
 
 def main():
     """Main function for testing the scheduler"""
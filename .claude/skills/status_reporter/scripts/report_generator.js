@@ -146,6 +146,17 @@ class StatusReporterJS {
                 FOREIGN KEY (report_id) REFERENCES reports (id)
             )
         `);
+
+        // Chart PNGs as BLOBs; the Python StatusReporter moves charts_json here
+        this.db.run(`
+            CREATE TABLE IF NOT EXISTS report_charts (
+                report_id TEXT,
+                chart_index INTEGER,
+                png BLOB,
+                PRIMARY KEY (report_id, chart_index),
+                FOREIGN KEY (report_id) REFERENCES reports (id)
+            )
+        `);
     }
 
     /**
@@ -451,7 +462,7 @@ class StatusReporterJS {
                 FROM reports WHERE id = ?
             `);
 
-            stmt.get([reportId], (err, row) => {
+            stmt.get([reportId], async (err, row) => {
                 if (err) {
                     reject(err);
                     return;
@@ -462,6 +473,14 @@ class StatusReporterJS {
                     return;
                 }
 
+                let charts;
+                try {
+                    charts = await this.loadCharts([row.id]);
+                } catch (chartErr) {
+                    reject(chartErr);
+                    return;
+                }
+
                 resolve(new StatusReport({
                     id: row.id,
                     title: row.title,
@@ -474,7 +493,7 @@ class StatusReporterJS {
                     status: row.status,
                     formatType: row.format_type,
                     metadata: JSON.parse(row.metadata_json || '{}'),
-                    charts: JSON.parse(row.charts_json || '[]')
+                    charts: charts.get(row.id) || JSON.parse(row.charts_json || '[]')
                 }));
             });
 
@@ -872,6 +891,40 @@ This report was automatically generated by StatusReporter
         });
     }
 
+    /**
+     * Loads base64-encoded charts from the report_charts table
+     * @param {string[]} reportIds - The report IDs
+     * @returns {Promise<Map<string, string[]>>} Charts in order, keyed by report ID (reports without rows are absent)
+     */
+    async loadCharts(reportIds) {
+        if (reportIds.length === 0) {
+            return new Map();
+        }
+
+        return new Promise((resolve, reject) => {
+            const placeholders = reportIds.map(() => '?').join(', ');
+            this.db.all(`
+                SELECT report_id, png FROM report_charts
+                WHERE report_id IN (${placeholders})
+                ORDER BY report_id, chart_index
+            `, reportIds, (err, rows) => {
+                if (err) {
+                    reject(err);
+                    return;
+                }
+
+                const charts = new Map();
+                for (const row of rows) {
+                    if (!charts.has(row.report_id)) {
+                        charts.set(row.report_id, []);
+                    }
+                    charts.get(row.report_id).push(row.png.toString('base64'));
+                }
+                resolve(charts);
+            });
+        });
+    }
+
     /**
      * Gets historical reports for a given period
      * @param {string} reportType - Optional report type filter
@@ -895,12 +948,20 @@ This report was automatically generated by StatusReporter
 
             const stmt = this.db.prepare(query);
 
-            stmt.all(params, (err, rows) => {
+            stmt.all(params, async (err, rows) => {
                 if (err) {
                     reject(err);
                     return;
                 }
 
+                let charts;
+                try {
+                    charts = await this.loadCharts(rows.map(row => row.id));
+                } catch (chartErr) {
+                    reject(chartErr);
+                    return;
+                }
+
                 const reports = rows.map(row => new StatusReport({
                     id: row.id,
                     title: row.title,
@@ -913,7 +974,7 @@ This report was automatically generated by StatusReporter
                     status: row.status,
                     formatType: row.format_type,
                     metadata: JSON.parse(row.metadata_json || '{}'),
-                    charts: JSON.parse(row.charts_json || '[]')
+                    charts: charts.get(row.id) || JSON.parse(row.charts_json || '[]')
                 }));
 
                 resolve(reports);
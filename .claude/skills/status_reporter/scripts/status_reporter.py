@@ -7,22 +7,198 @@ templates, distribution options, and integration with various data sources.
 """
 
 import os
+import argparse
+import re
+import sys
 import json
 import sqlite3
+import threading
+import queue
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional, Any, Union
+from typing import Callable, Dict, FrozenSet, Iterator, List, Sequence, Tuple, Optional, Any, Union
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from uuid import uuid4
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+# Charts are drawn on a bare Figure rather than through pyplot, so no GUI backend is set up
+from matplotlib.figure import Figure
 import matplotlib.dates as mdates
 from io import BytesIO
 import base64
+import binascii
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Stored in PRAGMA user_version once setup_database has built the schema;
+# bump it whenever the tables, indexes or migrations below change
+SCHEMA_VERSION = 1
+
+# Number of add_report_metric rows buffered before they are written
+METRIC_BUFFER_SIZE = 1000
+
+# Kept as one constant so the connection's statement cache reuses the prepared UPDATE
+SQL_UPDATE_REPORT_STATUS = 'UPDATE reports SET status = ?, updated_at = ? WHERE id = ?'
+
+# Per-status recipient counts for get_distribution_stats, served by idx_dist_report
+SQL_DISTRIBUTION_STATS = '''
+    SELECT status, COUNT(*) FROM distribution_log
+    WHERE report_id = ?
+    GROUP BY status
+'''
+
+# Resolution of generated chart PNGs
+CHART_DPI = 80
+
+# Rows fetched per round trip when iterating historical reports
+HISTORY_FETCH_SIZE = 1000
+
+# {{variable}} placeholders in report templates; {{{variable}}} is accepted as the same thing
+_TEMPLATE_VAR_PATTERN = re.compile(r"\{\{(\{)?(\w+)(?(1)\})\}\}")
+
+# Characters in a recipient address that are spelled out in output file names
+_RECIPIENT_FILENAME_PATTERN = re.compile(r"[@.]")
+_RECIPIENT_FILENAME_REPLACEMENTS = {'@': '_at_', '.': '_dot_'}
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value for a JSON text column."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _json_loads(raw: str) -> Any:
+    """Deserialize a JSON text column."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=1024)
+def _recipient_filename(recipient: str) -> str:
+    """Turn a recipient address into the suffix used in output file names."""
+    return _RECIPIENT_FILENAME_PATTERN.sub(lambda m: _RECIPIENT_FILENAME_REPLACEMENTS[m.group()], recipient)
+
+
+class _PlaceholderDict(dict):
+    """Template variables for str.format_map that leave unknown placeholders as written."""
+
+    __slots__ = ('placeholders',)
+
+    def __init__(self, variables: Dict[str, Any], placeholders: Dict[str, str]):
+        super().__init__(variables)
+        self.placeholders = placeholders
+
+    def __missing__(self, name: str) -> str:
+        return self.placeholders[name]
+
+
+@lru_cache(maxsize=128)
+def _compile_template(content_template: str) -> Callable[[Dict[str, Any]], str]:
+    """Compile a template's {{variable}} slots once and return its renderer."""
+    literals = []
+    slots = []
+    position = 0
+    for match in _TEMPLATE_VAR_PATTERN.finditer(content_template):
+        literals.append(content_template[position:match.start()])
+        slots.append((match.group(2), match.group(0)))
+        position = match.end()
+    literals.append(content_template[position:])
+
+    # Usually the template becomes a str.format string rendered in one C-level pass.
+    # Names format would read as positional fields, or a name spelled both as {{x}}
+    # and {{{x}}}, fall back to joining the pieces in Python.
+    placeholders = {}
+    for name, placeholder in slots:
+        if name[0].isdigit() or placeholders.setdefault(name, placeholder) != placeholder:
+            break
+    else:
+        format_string = literals[0].replace('{', '{{').replace('}', '}}') + "".join(
+            f"{{{name}}}" + literal.replace('{', '{{').replace('}', '}}')
+            for (name, _), literal in zip(slots, literals[1:])
+        )
+
+        def render(variables: Dict[str, Any]) -> str:
+            return format_string.format_map(_PlaceholderDict(variables, placeholders))
+
+        return render
+
+    def render(variables: Dict[str, Any]) -> str:
+        pieces = [literals[0]]
+        for (name, placeholder), literal in zip(slots, literals[1:]):
+            pieces.append(str(variables[name]) if name in variables else placeholder)
+            pieces.append(literal)
+        return "".join(pieces)
+
+    return render
+
+
+# Page wrappers around the shared report body; $body is filled in by _render_report_html
+_EMAIL_HTML_TEMPLATE = Template("""
+            <html>
+            <head>
+                <style>
+                    body { font-family: Arial, sans-serif; }
+                    h1, h2 { color: #333; }
+                    .section { margin: 20px 0; }
+                    .metric { background-color: #f5f5f5; padding: 10px; border-radius: 5px; }
+                </style>
+            </head>
+            <body>
+                $body
+            </body>
+            </html>
+            """)
+
+_HTML_DOCUMENT_TEMPLATE = Template("""
+            <!DOCTYPE html>
+            <html>
+            <head>
+                <title>Status Report: $title</title>
+                <style>
+                    body { font-family: Arial, sans-serif; margin: 40px; }
+                    h1, h2 { color: #333; }
+                    .section { margin: 20px 0; }
+                    .metric { background-color: #f5f5f5; padding: 10px; border-radius: 5px; }
+                    table { border-collapse: collapse; width: 100%; }
+                    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+                    th { background-color: #f2f2f2; }
+                </style>
+            </head>
+            <body>
+                $body
+            </body>
+            </html>
+            """)
+
+
+@lru_cache(maxsize=32)
+def _render_report_html(title: str, period_start: datetime, period_end: datetime, content: str,
+                        document: bool = False) -> str:
+    """Render a report as an email body, or as a standalone page when ``document`` is set."""
+    body = f"""<h1>{title}</h1>
+                <p><strong>Reporting Period:</strong> {period_start.strftime('%B %d, %Y')} to {period_end.strftime('%B %d, %Y')}</p>
+
+                {content}
+
+                <hr>
+                <p><em>This report was automatically generated by StatusReporter</em></p>"""
+    page = _HTML_DOCUMENT_TEMPLATE if document else _EMAIL_HTML_TEMPLATE
+    return page.substitute(title=title, body=body)
 
 
 class ReportType(Enum):
@@ -59,7 +235,7 @@ class StatusReport:
     status: str = "draft"  # draft, pending, sent, failed
     format_type: ReportFormat = ReportFormat.EMAIL
     metadata: Dict[str, Any] = field(default_factory=dict)
-    charts: List[str] = field(default_factory=list)  # Base64 encoded chart images
+    charts: List[bytes] = field(default_factory=list)  # PNG chart images
 
 
 @dataclass
@@ -72,6 +248,38 @@ class ReportTemplate:
     variables: List[str]
     created_at: datetime = field(default_factory=datetime.now)
     is_active: bool = True
+    # Set form of variables for checking supplied values
+    variable_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.variable_set = frozenset(self.variables)
+
+
+def _optional_json(default_factory: Callable[[], Any]) -> Callable[[Optional[str]], Any]:
+    """Return a decoder for a nullable JSON column that maps NULL/empty to a fresh default."""
+    return lambda raw: _json_loads(raw) if raw else default_factory()
+
+
+# StatusReport field -> (reports column, decoder applied to the stored value)
+_REPORT_COLUMNS: Dict[str, Tuple[str, Optional[Callable[[Any], Any]]]] = {
+    'id': ('id', None),
+    'title': ('title', None),
+    'report_type': ('report_type', ReportType),
+    'period_start': ('period_start', datetime.fromisoformat),
+    'period_end': ('period_end', datetime.fromisoformat),
+    'created_at': ('created_at', datetime.fromisoformat),
+    'content': ('content', None),
+    'recipients': ('recipients_json', _json_loads),
+    'status': ('status', None),
+    'format_type': ('format_type', ReportFormat),
+    'metadata': ('metadata_json', _optional_json(dict)),
+}
+
+# Charts live in the report_charts table rather than a reports column
+_REPORT_FIELDS = _REPORT_COLUMNS.keys() | {'charts'}
+
+# Fields StatusReport cannot be built without
+_REQUIRED_REPORT_FIELDS = ('id', 'title', 'report_type', 'period_start', 'period_end')
 
 
 class StatusReporter:
@@ -90,8 +298,34 @@ class StatusReporter:
     def __init__(self, db_path: str = "./reports.db", smtp_config: Optional[Dict[str, Any]] = None):
         self.db_path = db_path
         self.smtp_config = smtp_config or {}
+
+        # Idle connections, checked out per transaction so distribution workers
+        # can read in parallel under WAL. _db_lock only guards the write buffers.
+        self._db_lock = threading.RLock()
+        self._conn_pool = queue.LifoQueue()
+        # Cursor of the batch() open on the current thread, if any
+        self._local = threading.local()
         self.setup_database()
 
+        # Templates rarely change, so lookups are cached until create_template
+        self._template_cache: Dict[str, Optional[ReportTemplate]] = {}
+        self._default_template_cache: Dict[ReportType, Optional[ReportTemplate]] = {}
+
+        # Figure and PNG buffer reused by generate_chart
+        self._chart_lock = threading.Lock()
+        self._chart_fig = None
+        self._chart_buffer = BytesIO()
+
+        # Idle logged-in SMTP sessions shared by distribute_report's workers
+        self._smtp_pool = queue.LifoQueue()
+
+        # (report_id, recipient, status, error_message) rows from _log_distribution_result
+        # waiting for the end of distribute_report
+        self._dist_log_buffer: List[Tuple[str, str, str, str]] = []
+
+        # Rows from add_report_metric waiting to be written in one batch
+        self._metric_buffer: List[Tuple[str, str, float, str, str]] = []
+
         # Configure logging
         logging.basicConfig(
             level=logging.INFO,
@@ -103,70 +337,228 @@ class StatusReporter:
         )
         self.logger = logging.getLogger(__name__)
 
-    def setup_database(self):
-        """Initialize the database schema for report tracking."""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """Open a WAL-mode connection to the reports database."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn
+
+    def _checkout_conn(self) -> sqlite3.Connection:
+        """Take an idle pooled connection, opening a new one if none is free."""
+        try:
+            return self._conn_pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a cursor on a pooled connection, committing on success and rolling back on error."""
+        outer = getattr(self._local, 'cursor', None)
+        if outer is not None:
+            # Inside batch(), which commits or rolls back for everything at once
+            yield outer
+            return
+
+        conn = self._checkout_conn()
         cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            self._conn_pool.put(conn)
+
+    @contextmanager
+    def batch(self):
+        """Run several API calls on this thread as one transaction with a single commit.
+
+        Reads made through get_historical_reports inside the block only see committed rows.
+        """
+        if getattr(self._local, 'cursor', None) is not None:
+            yield
+            return
+        with self._transaction() as cursor:
+            self._local.cursor = cursor
+            try:
+                yield
+            finally:
+                self._local.cursor = None
 
-        # Create reports table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS reports (
-                id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                report_type TEXT,
-                period_start DATETIME,
-                period_end DATETIME,
-                created_at DATETIME,
-                content TEXT,
-                recipients_json TEXT,
-                status TEXT,
-                format_type TEXT,
-                metadata_json TEXT,
-                charts_json TEXT
-            )
-        ''')
-
-        # Create templates table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS templates (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                report_type TEXT,
-                content_template TEXT,
-                variables_json TEXT,
-                created_at DATETIME,
-                is_active BOOLEAN
-            )
-        ''')
-
-        # Create metrics table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS metrics (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                report_id TEXT,
-                metric_name TEXT,
-                metric_value REAL,
-                unit TEXT,
-                recorded_at DATETIME,
-                FOREIGN KEY (report_id) REFERENCES reports (id)
-            )
-        ''')
+    def _close_conn_pool(self) -> None:
+        """Close every idle pooled connection."""
+        while True:
+            try:
+                conn = self._conn_pool.get_nowait()
+            except queue.Empty:
+                return
+            conn.close()
+
+    def close(self) -> None:
+        """Flush buffered rows, release the chart figure, pooled SMTP sessions and database connections."""
+        self._close_smtp_pool()
+        with self._chart_lock:
+            self._chart_fig = None
+        with self._db_lock:
+            self.flush_metrics()
+            self._flush_distribution_log()
+        self._close_conn_pool()
+
+    def __del__(self):
+        if getattr(self, '_conn_pool', None) is None:
+            return
+        try:
+            self.flush_metrics()
+        except sqlite3.Error:
+            pass
+        self._close_conn_pool()
 
-        # Create distribution_log table
+    def setup_database(self):
+        """Initialize the database schema for report tracking."""
+        with self._transaction() as cursor:
+            # Schema already current, skip the DDL
+            cursor.execute('PRAGMA user_version')
+            if cursor.fetchone()[0] >= SCHEMA_VERSION:
+                return
+
+            # Create reports table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS reports (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    report_type TEXT,
+                    period_start DATETIME,
+                    period_end DATETIME,
+                    created_at DATETIME,
+                    content TEXT,
+                    recipients_json TEXT,
+                    status TEXT,
+                    format_type TEXT,
+                    metadata_json TEXT,
+                    charts_json TEXT,
+                    updated_at DATETIME
+                )
+            ''')
+
+            # Databases created before updated_at existed
+            cursor.execute('PRAGMA table_info(reports)')
+            if 'updated_at' not in {column[1] for column in cursor.fetchall()}:
+                cursor.execute('ALTER TABLE reports ADD COLUMN updated_at DATETIME')
+
+            # Create templates table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS templates (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    report_type TEXT,
+                    content_template TEXT,
+                    variables_json TEXT,
+                    created_at DATETIME,
+                    is_active BOOLEAN
+                )
+            ''')
+
+            # Create metrics table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    report_id TEXT,
+                    metric_name TEXT,
+                    metric_value REAL,
+                    unit TEXT,
+                    recorded_at DATETIME,
+                    FOREIGN KEY (report_id) REFERENCES reports (id)
+                )
+            ''')
+
+            # Create distribution_log table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS distribution_log (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    report_id TEXT,
+                    recipient TEXT,
+                    status TEXT,
+                    sent_at DATETIME,
+                    error_message TEXT,
+                    FOREIGN KEY (report_id) REFERENCES reports (id)
+                )
+            ''')
+
+            # Chart PNGs, stored as BLOBs instead of base64 text in reports.charts_json
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS report_charts (
+                    report_id TEXT,
+                    chart_index INTEGER,
+                    png BLOB,
+                    PRIMARY KEY (report_id, chart_index),
+                    FOREIGN KEY (report_id) REFERENCES reports (id)
+                )
+            ''')
+            self._migrate_legacy_charts(cursor)
+
+            # Indexes for the historical, metrics, distribution and default-template lookups
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_reports_type_created
+                ON reports(report_type, created_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_reports_created
+                ON reports(created_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_metrics_report
+                ON metrics(report_id, recorded_at DESC)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_dist_report
+                ON distribution_log(report_id, status)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_templates_type_active
+                ON templates(report_type, is_active, created_at DESC)
+            ''')
+
+            cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _migrate_legacy_charts(self, cursor: sqlite3.Cursor) -> None:
+        """Move base64 charts from reports.charts_json into report_charts."""
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS distribution_log (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                report_id TEXT,
-                recipient TEXT,
-                status TEXT,
-                sent_at DATETIME,
-                error_message TEXT,
-                FOREIGN KEY (report_id) REFERENCES reports (id)
-            )
+            SELECT id, charts_json FROM reports
+            WHERE charts_json IS NOT NULL AND charts_json != '[]'
         ''')
-
-        conn.commit()
-        conn.close()
+        legacy = cursor.fetchall()
+        if not legacy:
+            return
+
+        cursor.executemany(
+            'INSERT OR REPLACE INTO report_charts (report_id, chart_index, png) VALUES (?, ?, ?)',
+            [(report_id, index, base64.b64decode(chart))
+             for report_id, charts_json in legacy
+             for index, chart in enumerate(_json_loads(charts_json))]
+        )
+        cursor.executemany('UPDATE reports SET charts_json = NULL WHERE id = ?',
+                           [(report_id,) for report_id, _ in legacy])
+
+    def _load_charts(self, cursor: sqlite3.Cursor, report_ids: List[str]) -> Dict[str, List[bytes]]:
+        """Load the chart PNGs of several reports, in chart order."""
+        charts: Dict[str, List[bytes]] = {report_id: [] for report_id in report_ids}
+        if not report_ids:
+            return charts
+        placeholders = ', '.join('?' * len(report_ids))
+        cursor.execute(f'''
+            SELECT report_id, png FROM report_charts
+            WHERE report_id IN ({placeholders})
+            ORDER BY report_id, chart_index
+        ''', report_ids)
+        for report_id, png in cursor.fetchall():
+            charts[report_id].append(png)
+        return charts
 
     def create_report(self, title: str, report_type: ReportType, period_start: datetime,
                      period_end: datetime, recipients: List[str],
@@ -191,25 +583,31 @@ class StatusReporter:
         return report.id
 
     def _save_report_to_db(self, report: StatusReport) -> None:
-        """Save report to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO reports
-            (id, title, report_type, period_start, period_end, created_at,
-             content, recipients_json, status, format_type, metadata_json, charts_json)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            report.id, report.title, report.report_type.value,
-            report.period_start.isoformat(), report.period_end.isoformat(),
-            report.created_at.isoformat(), report.content,
-            json.dumps(report.recipients), report.status, report.format_type.value,
-            json.dumps(report.metadata), json.dumps(report.charts)
-        ))
-
-        conn.commit()
-        conn.close()
+        """Insert a report, or update it in place if it already exists."""
+        with self._transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO reports
+                (id, title, report_type, period_start, period_end, created_at,
+                 content, recipients_json, status, format_type, metadata_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    title = excluded.title,
+                    report_type = excluded.report_type,
+                    period_start = excluded.period_start,
+                    period_end = excluded.period_end,
+                    content = excluded.content,
+                    recipients_json = excluded.recipients_json,
+                    status = excluded.status,
+                    format_type = excluded.format_type,
+                    metadata_json = excluded.metadata_json,
+                    updated_at = ?
+            ''', (
+                report.id, report.title, report.report_type.value,
+                report.period_start.isoformat(), report.period_end.isoformat(),
+                report.created_at.isoformat(), report.content,
+                _json_dumps(report.recipients), report.status, report.format_type.value,
+                _json_dumps(report.metadata), datetime.now().isoformat()
+            ))
 
     def generate_report_content(self, report_id: str, template_id: Optional[str] = None,
                               variables: Optional[Dict[str, Any]] = None) -> str:
@@ -240,11 +638,12 @@ class StatusReporter:
         # Merge provided variables with defaults (provided variables take precedence)
         all_vars = {**default_vars, **(variables or {})}
 
-        # Replace template variables
-        content = template.content_template
-        for var_name, var_value in all_vars.items():
-            placeholder = f"{{{{{var_name}}}}}"
-            content = content.replace(placeholder, str(var_value))
+        missing = template.variable_set - all_vars.keys()
+        if missing:
+            self.logger.warning(f"No values for template variables: {', '.join(sorted(missing))}")
+
+        # Replace template variables; unknown placeholders are left as-is
+        content = _compile_template(template.content_template)(all_vars)
 
         # Add any dynamic content based on report type
         content = self._add_dynamic_content(content, report, all_vars)
@@ -256,6 +655,22 @@ class StatusReporter:
         self.logger.info(f"Generated content for report '{report.title}' (ID: {report.id})")
         return content
 
+    def generate_reports_content(self, jobs: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[str]:
+        """Generate content for several (report_id, variables) jobs, returning it in job order.
+
+        Jobs run on a thread pool so their SQLite reads and writes overlap. Inside batch()
+        they run one after another on the calling thread, which holds the write transaction.
+        """
+        if getattr(self._local, 'cursor', None) is not None or len(jobs) < 2:
+            return [self.generate_report_content(report_id, variables=variables) for report_id, variables in jobs]
+
+        max_workers = min(os.cpu_count() or 1, len(jobs))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda job: self.generate_report_content(job[0], variables=job[1]),
+                jobs
+            ))
+
     def _add_dynamic_content(self, content: str, report: StatusReport, variables: Dict[str, Any]) -> str:
         """Add dynamic content based on report type and variables."""
         # Add metrics if they exist
@@ -266,10 +681,11 @@ class StatusReporter:
                 metrics_section += f"- {metric['name']}: {metric['value']} {metric['unit']}\n"
             content += metrics_section
 
-        # Add charts if they exist
+        # Add charts if they exist; base64 is only needed for the inline data URI
         if report.charts:
             content += "\n## Charts\n"
-            for i, chart_base64 in enumerate(report.charts):
+            for i, chart_png in enumerate(report.charts):
+                chart_base64 = binascii.b2a_base64(chart_png, newline=False).decode('ascii')
                 content += f"<img src=\"data:image/png;base64,{chart_base64}\" alt=\"Chart {i+1}\">\n"
 
         # Customize based on report type
@@ -308,93 +724,95 @@ class StatusReporter:
 
     def _save_template_to_db(self, template: ReportTemplate) -> None:
         """Save template to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        with self._transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO templates
+                (id, name, report_type, content_template, variables_json, created_at, is_active)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                template.id, template.name, template.report_type.value,
+                template.content_template, _json_dumps(template.variables),
+                template.created_at.isoformat(), template.is_active
+            ))
 
-        cursor.execute('''
-            INSERT INTO templates
-            (id, name, report_type, content_template, variables_json, created_at, is_active)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            template.id, template.name, template.report_type.value,
-            template.content_template, json.dumps(template.variables),
-            template.created_at.isoformat(), template.is_active
-        ))
-
-        conn.commit()
-        conn.close()
+        # A new template can become the default for its type
+        self._template_cache.clear()
+        self._default_template_cache.clear()
 
     def get_template(self, template_id: str) -> Optional[ReportTemplate]:
-        """Retrieve a template by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Retrieve a template by ID (cached until the next create_template)."""
+        if template_id not in self._template_cache:
+            self._template_cache[template_id] = self._get_template_uncached(template_id)
+        return self._template_cache[template_id]
 
-        cursor.execute('''
-            SELECT id, name, report_type, content_template, variables_json, created_at, is_active
-            FROM templates WHERE id = ?
-        ''', (template_id,))
+    def _get_template_uncached(self, template_id: str) -> Optional[ReportTemplate]:
+        """Load a template by ID from the database."""
+        with self._transaction() as cursor:
+            cursor.execute('''
+                SELECT id, name, report_type, content_template, variables_json, created_at, is_active
+                FROM templates WHERE id = ?
+            ''', (template_id,))
 
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
 
         if not row:
             return None
 
         return ReportTemplate(
             id=row[0], name=row[1], report_type=ReportType(row[2]),
-            content_template=row[3], variables=json.loads(row[4]),
+            content_template=row[3], variables=_json_loads(row[4]),
             created_at=datetime.fromisoformat(row[5]), is_active=row[6]
         )
 
     def get_default_template(self, report_type: ReportType) -> Optional[ReportTemplate]:
-        """Get a default template for a report type."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, name, report_type, content_template, variables_json, created_at, is_active
-            FROM templates WHERE report_type = ? AND is_active = 1
-            ORDER BY created_at DESC LIMIT 1
-        ''', (report_type.value,))
-
-        row = cursor.fetchone()
-        conn.close()
+        """Get a default template for a report type (cached until the next create_template)."""
+        if report_type not in self._default_template_cache:
+            self._default_template_cache[report_type] = self._get_default_template_uncached(report_type)
+        return self._default_template_cache[report_type]
+
+    def _get_default_template_uncached(self, report_type: ReportType) -> Optional[ReportTemplate]:
+        """Load the newest active template for a report type from the database."""
+        with self._transaction() as cursor:
+            cursor.execute('''
+                SELECT id, name, report_type, content_template, variables_json, created_at, is_active
+                FROM templates WHERE report_type = ? AND is_active = 1
+                ORDER BY created_at DESC LIMIT 1
+            ''', (report_type.value,))
+
+            row = cursor.fetchone()
 
         if not row:
             return None
 
         return ReportTemplate(
             id=row[0], name=row[1], report_type=ReportType(row[2]),
-            content_template=row[3], variables=json.loads(row[4]),
+            content_template=row[3], variables=_json_loads(row[4]),
             created_at=datetime.fromisoformat(row[5]), is_active=row[6]
         )
 
     def get_report(self, report_id: str) -> Optional[StatusReport]:
         """Retrieve a report by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, title, report_type, period_start, period_end, created_at,
-                   content, recipients_json, status, format_type, metadata_json, charts_json
-            FROM reports WHERE id = ?
-        ''', (report_id,))
-
-        row = cursor.fetchone()
-        conn.close()
-
-        if not row:
-            return None
+        with self._transaction() as cursor:
+            cursor.execute('''
+                SELECT id, title, report_type, period_start, period_end, created_at,
+                       content, recipients_json, status, format_type, metadata_json
+                FROM reports WHERE id = ?
+            ''', (report_id,))
+
+            row = cursor.fetchone()
+            if not row:
+                return None
+            charts = self._load_charts(cursor, [report_id])[report_id]
 
         return StatusReport(
             id=row[0], title=row[1], report_type=ReportType(row[2]),
             period_start=datetime.fromisoformat(row[3]),
             period_end=datetime.fromisoformat(row[4]),
             created_at=datetime.fromisoformat(row[5]),
-            content=row[6], recipients=json.loads(row[7]),
+            content=row[6], recipients=_json_loads(row[7]),
             status=row[8], format_type=ReportFormat(row[9]),
-            metadata=json.loads(row[10]) if row[10] else {},
-            charts=json.loads(row[11]) if row[11] else []
+            metadata=_json_loads(row[10]) if row[10] else {},
+            charts=charts
         )
 
     def distribute_report(self, report_id: str) -> bool:
@@ -404,34 +822,26 @@ class StatusReporter:
             self.logger.error(f"Report {report_id} not found or not ready for distribution")
             return False
 
-        success = True
-        for recipient in report.recipients:
-            try:
-                if report.format_type == ReportFormat.EMAIL:
-                    sent = self._send_email_report(report, recipient)
-                elif report.format_type == ReportFormat.HTML:
-                    sent = self._save_html_report(report, recipient)
-                elif report.format_type == ReportFormat.PDF:
-                    sent = self._save_pdf_report(report, recipient)
-                elif report.format_type == ReportFormat.CSV:
-                    sent = self._save_csv_report(report, recipient)
-                elif report.format_type == ReportFormat.JSON:
-                    sent = self._save_json_report(report, recipient)
-                else:
-                    self.logger.error(f"Unsupported format: {report.format_type.value}")
-                    sent = False
-
-                # Log distribution result
-                self._log_distribution_result(report_id, recipient, "sent" if sent else "failed")
-
-                if not sent:
-                    success = False
-                    self.logger.error(f"Failed to distribute report to {recipient}")
-            except Exception as e:
-                self.logger.error(f"Error distributing report to {recipient}: {str(e)}")
-                self._log_distribution_result(report_id, recipient, "failed", str(e))
-                success = False
+        # CSV and JSON output embed the metrics; fetch them once for every recipient
+        metrics = None
+        if report.format_type in (ReportFormat.CSV, ReportFormat.JSON):
+            metrics = self.get_report_metrics(report_id)
 
+        # Recipients are independent network/file I/O, so fan them out; each
+        # worker holds at most one pooled SMTP session at a time
+        max_workers = max(1, min(self.smtp_config.get('concurrency', 5), len(report.recipients)))
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda recipient: self._distribute_to_recipient(report, recipient, metrics),
+                    report.recipients
+                ))
+        finally:
+            self._close_smtp_pool()
+            # One commit for every recipient's log row
+            self._flush_distribution_log()
+
+        success = all(results)
         if success:
             # Update report status to indicate it was sent
             self._update_report_status(report_id, "sent")
@@ -442,7 +852,30 @@ class StatusReporter:
 
         return success
 
-    def _send_email_report(self, report: StatusReport, recipient: str) -> bool:
+    def _distribute_to_recipient(self, report: StatusReport, recipient: str,
+                                 metrics: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Deliver a report to one recipient and log the result."""
+        try:
+            handler = self._FORMAT_HANDLERS.get(report.format_type)
+            if handler is None:
+                self.logger.error(f"Unsupported format: {report.format_type.value}")
+                sent = False
+            else:
+                sent = handler(self, report, recipient, metrics)
+
+            # Log distribution result
+            self._log_distribution_result(report.id, recipient, "sent" if sent else "failed")
+
+            if not sent:
+                self.logger.error(f"Failed to distribute report to {recipient}")
+            return sent
+        except Exception as e:
+            self.logger.error(f"Error distributing report to {recipient}: {str(e)}")
+            self._log_distribution_result(report.id, recipient, "failed", str(e))
+            return False
+
+    def _send_email_report(self, report: StatusReport, recipient: str,
+                           metrics: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Send a report via email."""
         if not self.smtp_config:
             self.logger.error("SMTP configuration not provided")
@@ -454,75 +887,68 @@ class StatusReporter:
             msg['From'] = self.smtp_config.get('from_email', 'noreply@example.com')
             msg['To'] = recipient
 
-            # Create HTML content
-            html_content = f"""
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; }}
-                    h1, h2 {{ color: #333; }}
-                    .section {{ margin: 20px 0; }}
-                    .metric {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; }}
-                </style>
-            </head>
-            <body>
-                <h1>{report.title}</h1>
-                <p><strong>Reporting Period:</strong> {report.period_start.strftime('%B %d, %Y')} to {report.period_end.strftime('%B %d, %Y')}</p>
-
-                {report.content}
-
-                <hr>
-                <p><em>This report was automatically generated by StatusReporter</em></p>
-            </body>
-            </html>
-            """
+            # The body is identical for every recipient, so it is rendered once per report
+            html_content = _render_report_html(report.title, report.period_start, report.period_end, report.content)
 
             msg.attach(MIMEText(html_content, 'html'))
 
-            # Connect to server and send email
-            server = smtplib.SMTP(self.smtp_config['smtp_server'], self.smtp_config['smtp_port'])
-            server.starttls()
-            server.login(self.smtp_config['username'], self.smtp_config['password'])
-
-            server.send_message(msg)
-            server.quit()
+            # Send over a pooled session, reconnecting once if the server dropped it
+            server = self._checkout_smtp()
+            try:
+                try:
+                    server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    server.close()
+                    server = self._connect_smtp()
+                    server.send_message(msg)
+            except Exception:
+                self._quit_smtp(server)
+                raise
+            self._smtp_pool.put(server)
 
             return True
         except Exception as e:
             self.logger.error(f"Failed to send email: {str(e)}")
             return False
 
-    def _save_html_report(self, report: StatusReport, recipient: str) -> bool:
-        """Save a report as HTML file."""
+    def _connect_smtp(self) -> smtplib.SMTP:
+        """Open and log in a new SMTP session."""
+        server = smtplib.SMTP(self.smtp_config['smtp_server'], self.smtp_config['smtp_port'])
+        server.starttls()
+        server.login(self.smtp_config['username'], self.smtp_config['password'])
+        return server
+
+    def _checkout_smtp(self) -> smtplib.SMTP:
+        """Take an idle SMTP session from the pool, connecting a new one if none is idle."""
         try:
-            html_content = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Status Report: {report.title}</title>
-                <style>
-                    body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                    h1, h2 {{ color: #333; }}
-                    .section {{ margin: 20px 0; }}
-                    .metric {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; }}
-                    table {{ border-collapse: collapse; width: 100%; }}
-                    th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                    th {{ background-color: #f2f2f2; }}
-                </style>
-            </head>
-            <body>
-                <h1>{report.title}</h1>
-                <p><strong>Reporting Period:</strong> {report.period_start.strftime('%B %d, %Y')} to {report.period_end.strftime('%B %d, %Y')}</p>
+            return self._smtp_pool.get_nowait()
+        except queue.Empty:
+            return self._connect_smtp()
 
-                {report.content}
+    def _quit_smtp(self, server: smtplib.SMTP) -> None:
+        """Close an SMTP session, dropping the connection if QUIT fails."""
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
 
-                <hr>
-                <p><em>This report was automatically generated by StatusReporter</em></p>
-            </body>
-            </html>
-            """
+    def _close_smtp_pool(self) -> None:
+        """Close every idle pooled SMTP session."""
+        while True:
+            try:
+                server = self._smtp_pool.get_nowait()
+            except queue.Empty:
+                return
+            self._quit_smtp(server)
 
-            filename = f"report_{report.id}_{report.period_start.strftime('%Y%m%d')}_{recipient.replace('@', '_at_').replace('.', '_dot_')}.html"
+    def _save_html_report(self, report: StatusReport, recipient: str,
+                          metrics: Optional[List[Dict[str, Any]]] = None) -> bool:
+        """Save a report as HTML file."""
+        try:
+            html_content = _render_report_html(report.title, report.period_start, report.period_end,
+                                               report.content, document=True)
+
+            filename = f"report_{report.id}_{report.period_start.strftime('%Y%m%d')}_{_recipient_filename(recipient)}.html"
             filepath = os.path.join(self._get_output_dir(), filename)
 
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -534,7 +960,8 @@ class StatusReporter:
             self.logger.error(f"Failed to save HTML report: {str(e)}")
             return False
 
-    def _save_pdf_report(self, report: StatusReport, recipient: str) -> bool:
+    def _save_pdf_report(self, report: StatusReport, recipient: str,
+                         metrics: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Save a report as PDF file."""
         # For simplicity, we'll create a text file that could be converted to PDF
         # In a real implementation, this would use a library like ReportLab
@@ -548,7 +975,7 @@ Reporting Period: {report.period_start.strftime('%B %d, %Y')} to {report.period_
 This report was automatically generated by StatusReporter
 """
 
-            filename = f"report_{report.id}_{report.period_start.strftime('%Y%m%d')}_{recipient.replace('@', '_at_').replace('.', '_dot_')}.txt"
+            filename = f"report_{report.id}_{report.period_start.strftime('%Y%m%d')}_{_recipient_filename(recipient)}.txt"
             filepath = os.path.join(self._get_output_dir(), filename)
 
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -560,16 +987,18 @@ This report was automatically generated by StatusReporter
             self.logger.error(f"Failed to save PDF report: {str(e)}")
             return False
 
-    def _save_csv_report(self, report: StatusReport, recipient: str) -> bool:
+    def _save_csv_report(self, report: StatusReport, recipient: str,
+                         metrics: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Save report metrics as CSV file."""
         try:
-            metrics = self.get_report_metrics(report.id)
+            if metrics is None:
+                metrics = self.get_report_metrics(report.id)
             if not metrics:
                 self.logger.warning(f"No metrics found for report {report.id}")
                 return True
 
             import csv
-            filename = f"report_metrics_{report.id}_{report.period_start.strftime('%Y%m%d')}_{recipient.replace('@', '_at_').replace('.', '_dot_')}.csv"
+            filename = f"report_metrics_{report.id}_{report.period_start.strftime('%Y%m%d')}_{_recipient_filename(recipient)}.csv"
             filepath = os.path.join(self._get_output_dir(), filename)
 
             with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
@@ -591,9 +1020,12 @@ This report was automatically generated by StatusReporter
             self.logger.error(f"Failed to save CSV report: {str(e)}")
             return False
 
-    def _save_json_report(self, report: StatusReport, recipient: str) -> bool:
+    def _save_json_report(self, report: StatusReport, recipient: str,
+                          metrics: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Save report as JSON file."""
         try:
+            if metrics is None:
+                metrics = self.get_report_metrics(report.id)
             report_data = {
                 'id': report.id,
                 'title': report.title,
@@ -607,14 +1039,18 @@ This report was automatically generated by StatusReporter
                 'format_type': report.format_type.value,
                 'metadata': report.metadata,
                 'charts_count': len(report.charts),
-                'metrics': self.get_report_metrics(report.id)
+                'metrics': metrics
             }
 
-            filename = f"report_{report.id}_{report.period_start.strftime('%Y%m%d')}_{recipient.replace('@', '_at_').replace('.', '_dot_')}.json"
+            filename = f"report_{report.id}_{report.period_start.strftime('%Y%m%d')}_{_recipient_filename(recipient)}.json"
             filepath = os.path.join(self._get_output_dir(), filename)
 
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(report_data, f, indent=2, ensure_ascii=False)
 
             self.logger.info(f"Saved JSON report to {filepath}")
             return True
@@ -622,135 +1058,196 @@ This report was automatically generated by StatusReporter
             self.logger.error(f"Failed to save JSON report: {str(e)}")
             return False
 
+    # Delivery method per format, looked up once per recipient by _distribute_to_recipient.
+    # Every handler takes (self, report, recipient, metrics); metrics is only used by CSV and JSON.
+    _FORMAT_HANDLERS = {
+        ReportFormat.EMAIL: _send_email_report,
+        ReportFormat.HTML: _save_html_report,
+        ReportFormat.PDF: _save_pdf_report,
+        ReportFormat.CSV: _save_csv_report,
+        ReportFormat.JSON: _save_json_report,
+    }
+
     def _get_output_dir(self) -> str:
         """Get the output directory for reports."""
         output_dir = "output_reports"
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        # Distribution workers may race to create it
+        os.makedirs(output_dir, exist_ok=True)
         return output_dir
 
     def _log_distribution_result(self, report_id: str, recipient: str, status: str, error_msg: str = "") -> None:
-        """Log the result of report distribution."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO distribution_log
-            (report_id, recipient, status, sent_at, error_message)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (report_id, recipient, status, datetime.now().isoformat(), error_msg))
-
-        conn.commit()
-        conn.close()
+        """Record the result of report distribution (written by _flush_distribution_log)."""
+        with self._db_lock:
+            self._dist_log_buffer.append((report_id, recipient, status, error_msg))
+
+    def _flush_distribution_log(self) -> None:
+        """Write buffered distribution results in one transaction, stamped with one sent_at."""
+        with self._db_lock:
+            if not self._dist_log_buffer:
+                return
+            rows, self._dist_log_buffer = self._dist_log_buffer, []
+            sent_at = datetime.now().isoformat()
+            with self._transaction() as cursor:
+                cursor.executemany('''
+                    INSERT INTO distribution_log
+                    (report_id, recipient, status, sent_at, error_message)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', [(report_id, recipient, status, sent_at, error_msg)
+                      for report_id, recipient, status, error_msg in rows])
 
     def _update_report_status(self, report_id: str, status: str) -> None:
         """Update the status of a report."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            UPDATE reports SET status = ?, updated_at = ?
-            WHERE id = ?
-        ''', (status, datetime.now().isoformat(), report_id))
-
-        conn.commit()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute(SQL_UPDATE_REPORT_STATUS, (status, datetime.now().isoformat(), report_id))
 
     def add_report_metric(self, report_id: str, metric_name: str, metric_value: float, unit: str = "") -> None:
-        """Add a metric to a report."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO metrics
-            (report_id, metric_name, metric_value, unit, recorded_at)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (report_id, metric_name, metric_value, unit, datetime.now().isoformat()))
-
-        conn.commit()
-        conn.close()
+        """Add a metric to a report (buffered until flush_metrics() or the buffer fills)."""
+        with self._db_lock:
+            self._metric_buffer.append((report_id, metric_name, metric_value, unit, datetime.now().isoformat()))
+            if len(self._metric_buffer) >= METRIC_BUFFER_SIZE:
+                self.flush_metrics()
 
         self.logger.info(f"Added metric '{metric_name}' to report {report_id}")
 
+    def add_report_metrics(self, report_id: str, metrics: List[Tuple[str, float, str]]) -> None:
+        """Add several (name, value, unit) metrics to a report in one transaction."""
+        recorded_at = datetime.now().isoformat()
+        self._insert_metrics([(report_id, name, value, unit, recorded_at) for name, value, unit in metrics])
+        self.logger.info(f"Added {len(metrics)} metrics to report {report_id}")
+
+    def flush_metrics(self) -> None:
+        """Write metrics buffered by add_report_metric to the database."""
+        with self._db_lock:
+            if not self._metric_buffer:
+                return
+            rows, self._metric_buffer = self._metric_buffer, []
+            self._insert_metrics(rows)
+
+    def _insert_metrics(self, rows: List[Tuple[str, str, float, str, str]]) -> None:
+        """Insert (report_id, name, value, unit, recorded_at) rows with a single executemany."""
+        with self._transaction() as cursor:
+            cursor.executemany('''
+                INSERT INTO metrics
+                (report_id, metric_name, metric_value, unit, recorded_at)
+                VALUES (?, ?, ?, ?, ?)
+            ''', rows)
+
     def get_report_metrics(self, report_id: str) -> List[Dict[str, Any]]:
         """Get metrics for a report."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT metric_name, metric_value, unit, recorded_at
-            FROM metrics
-            WHERE report_id = ?
-            ORDER BY recorded_at DESC
-        ''', (report_id,))
-
-        metrics = []
-        for row in cursor.fetchall():
-            metrics.append({
-                'name': row[0],
-                'value': row[1],
-                'unit': row[2],
-                'recorded_at': row[3]
-            })
-
-        conn.close()
+        # Buffered metrics must be visible to readers
+        self.flush_metrics()
+
+        with self._transaction() as cursor:
+            cursor.execute('''
+                SELECT metric_name, metric_value, unit, recorded_at
+                FROM metrics
+                WHERE report_id = ?
+                ORDER BY recorded_at DESC
+            ''', (report_id,))
+
+            metrics = []
+            for row in cursor.fetchall():
+                metrics.append({
+                    'name': row[0],
+                    'value': row[1],
+                    'unit': row[2],
+                    'recorded_at': row[3]
+                })
         return metrics
 
-    def generate_chart(self, data: List[Tuple], title: str, chart_type: str = "line") -> str:
-        """Generate a chart and return as base64 string."""
-        fig, ax = plt.subplots(figsize=(10, 6))
-
+    def generate_chart(self, data: List[Tuple], title: str, chart_type: str = "line") -> bytes:
+        """Generate a chart from (x, value) pairs and return it as PNG bytes."""
+        x, y = zip(*data)
+        return self.generate_series_chart(x, y, title, chart_type)
+
+    def generate_series_chart(self, x: Sequence, y: Sequence, title: str, chart_type: str = "line") -> bytes:
+        """Generate a chart from separate x and value sequences and return it as PNG bytes.
+
+        NumPy arrays are passed to matplotlib as-is, without building per-point tuples.
+        """
+        # Building a Figure is expensive, so one is kept and cleared between charts
+        with self._chart_lock:
+            if self._chart_fig is None:
+                self._chart_fig = Figure(figsize=(10, 6))
+            fig = self._chart_fig
+            fig.clf()
+            ax = fig.add_subplot(111)
+            return self._draw_chart(fig, ax, x, y, title, chart_type)
+
+    def _draw_chart(self, fig, ax, x: Sequence, y: Sequence, title: str, chart_type: str) -> bytes:
+        """Draw a chart on the given axes and return the figure as PNG bytes."""
         if chart_type == "line":
-            dates, values = zip(*data)
-            ax.plot(dates, values, marker='o')
+            ax.plot(x, y, marker='o')
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%d'))
             ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
         elif chart_type == "bar":
-            labels, values = zip(*data)
-            ax.bar(labels, values)
+            ax.bar(x, y)
         elif chart_type == "pie":
-            labels, values = zip(*data)
-            ax.pie(values, labels=labels, autopct='%1.1f%%')
+            ax.pie(y, labels=x, autopct='%1.1f%%')
 
         ax.set_title(title)
         ax.grid(True)
 
         # Rotate x-axis labels if they're dates
         if chart_type == "line":
-            plt.xticks(rotation=45)
+            ax.tick_params(axis='x', labelrotation=45)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save to bytes
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png')
+        buffer = self._chart_buffer
         buffer.seek(0)
-        image_png = buffer.getvalue()
-        buffer.close()
-        plt.close(fig)
-
-        # Convert to base64
-        graphic = base64.b64encode(image_png)
-        return graphic.decode('utf-8')
+        buffer.truncate()
+        fig.savefig(buffer, format='png', dpi=CHART_DPI)
+        return buffer.getvalue()
 
-    def add_chart_to_report(self, report_id: str, chart_base64: str) -> None:
+    def add_chart_to_report(self, report_id: str, chart_png: bytes) -> None:
         """Add a chart to a report."""
-        report = self.get_report(report_id)
-        if not report:
+        # Append in a single statement instead of loading and re-saving the whole report
+        with self._transaction() as cursor:
+            cursor.execute('''
+                INSERT INTO report_charts (report_id, chart_index, png)
+                SELECT id,
+                       (SELECT COALESCE(MAX(chart_index) + 1, 0) FROM report_charts WHERE report_id = reports.id),
+                       ?
+                FROM reports WHERE id = ?
+            ''', (chart_png, report_id))
+            added = cursor.rowcount > 0
+
+        if not added:
             raise ValueError(f"Report with ID {report_id} not found")
 
-        report.charts.append(chart_base64)
-        self._save_report_to_db(report)
-
     def get_historical_reports(self, report_type: Optional[ReportType] = None,
                              days_back: int = 30) -> List[StatusReport]:
         """Get historical reports for a given period."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        return list(self.iter_historical_reports(report_type, days_back))
+
+    def iter_historical_reports(self, report_type: Optional[ReportType] = None, days_back: int = 30,
+                                fields: Optional[List[str]] = None) -> Iterator[StatusReport]:
+        """
+        Yield historical reports for a given period, newest first.
+
+        Rows are fetched in batches rather than all at once. When ``fields`` names
+        StatusReport fields, only those columns (plus the required identity and
+        period fields) are selected and decoded; the rest keep their defaults.
+        """
+        if fields is None:
+            selected = list(_REPORT_COLUMNS)
+            load_charts = True
+        else:
+            unknown = set(fields) - _REPORT_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown report fields: {', '.join(sorted(unknown))}")
+            selected = list(_REQUIRED_REPORT_FIELDS) + [
+                f for f in fields if f not in _REQUIRED_REPORT_FIELDS and f != 'charts'
+            ]
+            load_charts = 'charts' in fields
 
-        cutoff_date = datetime.now() - timedelta(days=days_back)
+        columns = [_REPORT_COLUMNS[name][0] for name in selected]
+        converters = [_REPORT_COLUMNS[name][1] for name in selected]
 
-        query = "SELECT id, title, report_type, period_start, period_end, created_at, content, recipients_json, status, format_type, metadata_json, charts_json FROM reports WHERE created_at >= ?"
+        cutoff_date = datetime.now() - timedelta(days=days_back)
+        query = f"SELECT {', '.join(columns)} FROM reports WHERE created_at >= ?"
         params = [cutoff_date.isoformat()]
 
         if report_type:
@@ -759,59 +1256,41 @@ This report was automatically generated by StatusReporter
 
         query += " ORDER BY created_at DESC"
 
-        cursor.execute(query, params)
-
-        reports = []
-        for row in cursor.fetchall():
-            reports.append(StatusReport(
-                id=row[0], title=row[1], report_type=ReportType(row[2]),
-                period_start=datetime.fromisoformat(row[3]),
-                period_end=datetime.fromisoformat(row[4]),
-                created_at=datetime.fromisoformat(row[5]),
-                content=row[6], recipients=json.loads(row[7]),
-                status=row[8], format_type=ReportFormat(row[9]),
-                metadata=json.loads(row[10]) if row[10] else {},
-                charts=json.loads(row[11]) if row[11] else []
-            ))
-
-        conn.close()
-        return reports
+        # The generator keeps its own connection until it is exhausted or closed
+        conn = self._checkout_conn()
+        cursor = conn.cursor()
+        cursor.arraysize = HISTORY_FETCH_SIZE
+        try:
+            cursor.execute(query, params)
+            while True:
+                rows = cursor.fetchmany()
+                if not rows:
+                    return
+                if load_charts:
+                    with self._transaction() as chart_cursor:
+                        charts = self._load_charts(chart_cursor, [row[0] for row in rows])
+                for row in rows:
+                    report = StatusReport(**{
+                        name: convert(value) if convert else value
+                        for name, convert, value in zip(selected, converters, row)
+                    })
+                    if load_charts:
+                        report.charts = charts[report.id]
+                    yield report
+        finally:
+            cursor.close()
+            self._conn_pool.put(conn)
 
     def get_distribution_stats(self, report_id: str) -> Dict[str, Any]:
         """Get distribution statistics for a report."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT status, COUNT(*) as count
-            FROM distribution_log
-            WHERE report_id = ?
-            GROUP BY status
-        ''', (report_id,))
-
-        stats = {}
-        for row in cursor.fetchall():
-            stats[row[0]] = row[1]
-
-        conn.close()
-        return stats
-
-
-def main():
-    """Main function for running the status reporter."""
-    import argparse
-
-    parser = argparse.ArgumentParser(description='Status Reporter')
-    parser.add_argument('--db-path', default='./reports.db', help='Path to database file')
-    parser.add_argument('--demo', action='store_true', help='Run demonstration')
+        with self._transaction() as cursor:
+            cursor.execute(SQL_DISTRIBUTION_STATS, (report_id,))
+            # Interned so the keys are the same objects as the "sent"/"failed" literals
+            return {sys.intern(status): count for status, count in cursor.fetchall()}
 
-    args = parser.parse_args()
 
-    reporter = StatusReporter(db_path=args.db_path)
-
-    if args.demo:
-        # Create some demo templates
-        daily_template = """
+# Templates created by the --demo run
+DAILY_TEMPLATE = """
 <h2>Daily Standup Report - {{{period_start}}} to {{{period_end}}}</h2>
 
 <h3>What I accomplished yesterday:</h3>
@@ -835,7 +1314,7 @@ def main():
 <p>Next priorities: {{{next_priorities}}}</p>
 """
 
-        weekly_template = """
+WEEKLY_TEMPLATE = """
 <h2>Weekly Status Report - {{{period_start}}} to {{{period_end}}}</h2>
 
 <h3>Key Accomplishments:</h3>
@@ -862,71 +1341,93 @@ def main():
 <p>{{{next_week_focus}}}</p>
 """
 
-        # Create templates
-        daily_template_id = reporter.create_template(
-            name="Daily Standup",
-            report_type=ReportType.DAILY,
-            content_template=daily_template,
-            variables=["task_1_yesterday", "task_2_yesterday", "priority_1_today", "priority_2_today",
-                      "blocker_1", "blocker_2", "next_priorities"]
-        )
 
-        weekly_template_id = reporter.create_template(
-            name="Weekly Status",
-            report_type=ReportType.WEEKLY,
-            content_template=weekly_template,
-            variables=["accomplishment_1", "accomplishment_2", "accomplishment_3",
-                      "priority_1", "priority_2", "priority_3", "risk_1", "risk_2", "next_week_focus"]
-        )
+def main():
+    """Main function for running the status reporter."""
+    parser = argparse.ArgumentParser(description='Status Reporter')
+    parser.add_argument('--db-path', default='./reports.db', help='Path to database file')
+    parser.add_argument('--demo', action='store_true', help='Run demonstration')
 
-        print(f"Created templates: Daily ({daily_template_id}), Weekly ({weekly_template_id})")
+    args = parser.parse_args()
 
-        # Create a demo report
-        report_id = reporter.create_report(
-            title="Week of February 1-5, 2026",
-            report_type=ReportType.WEEKLY,
-            period_start=datetime.now() - timedelta(days=7),
-            period_end=datetime.now(),
-            recipients=["manager@company.com", "team@company.com"],
-            format_type=ReportFormat.EMAIL
-        )
+    reporter = StatusReporter(db_path=args.db_path)
 
-        print(f"Created report: {report_id}")
-
-        # Generate content with variables
-        content = reporter.generate_report_content(
-            report_id,
-            variables={
-                "accomplishment_1": "Completed API integration for customer portal",
-                "accomplishment_2": "Resolved critical security vulnerability",
-                "accomplishment_3": "Deployed new analytics dashboard",
-                "priority_1": "Finish user authentication system",
-                "priority_2": "Prepare for Q1 planning session",
-                "priority_3": "Review and refactor legacy code",
-                "risk_1": "Potential delay in third-party API availability",
-                "risk_2": "Resource constraint for upcoming sprint",
-                "next_week_focus": "Focus on authentication system and sprint planning"
-            }
-        )
+    if args.demo:
+        # Set up the demo data in one transaction instead of one commit per call
+        with reporter.batch():
+            # Create templates
+            daily_template_id = reporter.create_template(
+                name="Daily Standup",
+                report_type=ReportType.DAILY,
+                content_template=DAILY_TEMPLATE,
+                variables=["task_1_yesterday", "task_2_yesterday", "priority_1_today", "priority_2_today",
+                          "blocker_1", "blocker_2", "next_priorities"]
+            )
+
+            weekly_template_id = reporter.create_template(
+                name="Weekly Status",
+                report_type=ReportType.WEEKLY,
+                content_template=WEEKLY_TEMPLATE,
+                variables=["accomplishment_1", "accomplishment_2", "accomplishment_3",
+                          "priority_1", "priority_2", "priority_3", "risk_1", "risk_2", "next_week_focus"]
+            )
+
+            print(f"Created templates: Daily ({daily_template_id}), Weekly ({weekly_template_id})")
+
+            # Create a demo report covering the week up to now
+            now = datetime.now()
+            report_id = reporter.create_report(
+                title="Week of February 1-5, 2026",
+                report_type=ReportType.WEEKLY,
+                period_start=now - timedelta(days=7),
+                period_end=now,
+                recipients=["manager@company.com", "team@company.com"],
+                format_type=ReportFormat.EMAIL
+            )
+
+            print(f"Created report: {report_id}")
+
+            # Generate content with variables
+            content = reporter.generate_report_content(
+                report_id,
+                variables={
+                    "accomplishment_1": "Completed API integration for customer portal",
+                    "accomplishment_2": "Resolved critical security vulnerability",
+                    "accomplishment_3": "Deployed new analytics dashboard",
+                    "priority_1": "Finish user authentication system",
+                    "priority_2": "Prepare for Q1 planning session",
+                    "priority_3": "Review and refactor legacy code",
+                    "risk_1": "Potential delay in third-party API availability",
+                    "risk_2": "Resource constraint for upcoming sprint",
+                    "next_week_focus": "Focus on authentication system and sprint planning"
+                }
+            )
+
+            print("Generated report content")
 
-        print("Generated report content")
+            # Generate a sample chart
+            # The last six days as one datetime64 array
+            dates = np.datetime64('today', 'D') - np.arange(5, -1, -1, dtype='timedelta64[D]')
+            values = np.array([10, 12, 14, 11, 15, 12], dtype=np.float64)
 
-        # Add some metrics
-        reporter.add_report_metric(report_id, "Tasks Completed", 12, "tasks")
-        reporter.add_report_metric(report_id, "Bugs Resolved", 5, "bugs")
-        reporter.add_report_metric(report_id, "Hours Worked", 40, "hours")
+            # Render the chart in the background while the metrics are written
+            with ThreadPoolExecutor(max_workers=1) as chart_executor:
+                chart_future = chart_executor.submit(
+                    reporter.generate_series_chart, dates, values, "Weekly Task Completion", "line"
+                )
 
-        print("Added metrics to report")
+                # Add some metrics
+                reporter.add_report_metrics(report_id, [
+                    ("Tasks Completed", 12, "tasks"),
+                    ("Bugs Resolved", 5, "bugs"),
+                    ("Hours Worked", 40, "hours"),
+                ])
 
-        # Generate a sample chart
-        dates = [datetime.now() - timedelta(days=i) for i in range(5, -1, -1)]
-        values = [10, 12, 14, 11, 15, 12]
-        data_points = [(date, val) for date, val in zip(dates, values)]
+                print("Added metrics to report")
 
-        chart_base64 = reporter.generate_chart(data_points, "Weekly Task Completion", "line")
-        reporter.add_chart_to_report(report_id, chart_base64)
+                reporter.add_chart_to_report(report_id, chart_future.result())
 
-        print("Added chart to report")
+            print("Added chart to report")
 
         # Print the generated content
         report = reporter.get_report(report_id)
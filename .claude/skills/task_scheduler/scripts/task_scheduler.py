@@ -10,6 +10,8 @@ task execution.
 import os
 import json
 import sqlite3
+import queue
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional, Callable, Any
 import threading
@@ -22,6 +24,34 @@ import heapq
 from collections import defaultdict
 
 
+# Statements shared by every pooled connection, so each connection's statement cache reuses them
+SQL_SAVE_TASK = '''
+    INSERT OR REPLACE INTO tasks
+    (id, name, description, function, args_json, kwargs_json,
+     scheduled_time, recurrence_type, recurrence_interval, priority,
+     dependencies_json, max_duration_seconds, notify_on_completion,
+     notify_on_failure, created_at, updated_at, status,
+     result_json, error_message, assigned_resources_json,
+     estimated_duration_seconds)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SQL_LOAD_TASK = '''
+    SELECT id, name, description, function, args_json, kwargs_json,
+           scheduled_time, recurrence_type, recurrence_interval, priority,
+           dependencies_json, max_duration_seconds, notify_on_completion,
+           notify_on_failure, created_at, updated_at, status,
+           result_json, error_message, assigned_resources_json,
+           estimated_duration_seconds
+    FROM tasks WHERE id = ?
+'''
+
+SQL_LOG_TASK_STATUS = '''
+    INSERT INTO task_logs (task_id, timestamp, status, message)
+    VALUES (?, ?, ?, ?)
+'''
+
+
 class Priority(Enum):
     """Task priority levels."""
     LOW = 1
@@ -119,6 +149,8 @@ class TaskScheduler:
         self.running = False
         self.scheduler_thread = None
 
+        # Idle connections reused across calls and task threads instead of one per call
+        self._conn_pool = queue.LifoQueue()
         self.setup_database()
 
         # Configure logging
@@ -132,52 +164,102 @@ class TaskScheduler:
         )
         self.logger = logging.getLogger(__name__)
 
-    def setup_database(self):
-        """Initialize the database schema for task tracking."""
-        conn = sqlite3.connect(self.db_path)
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the task database with WAL and tuned PRAGMAs."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # WAL lets the scheduler read task rows while worker threads commit
+        if self.db_path != ":memory:":
+            conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA busy_timeout=5000')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-20000')
+        return conn
+
+    def _checkout_conn(self) -> sqlite3.Connection:
+        """Take an idle pooled connection, opening a new one if none is free."""
+        try:
+            return self._conn_pool.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    @contextmanager
+    def _transaction(self):
+        """Yield a cursor on a pooled connection, committing on success and rolling back on error."""
+        conn = self._checkout_conn()
         cursor = conn.cursor()
+        try:
+            yield cursor
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            self._conn_pool.put(conn)
 
-        # Create tasks table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tasks (
-                id TEXT PRIMARY KEY,
-                name TEXT NOT NULL,
-                description TEXT,
-                function TEXT,
-                args_json TEXT,
-                kwargs_json TEXT,
-                scheduled_time DATETIME,
-                recurrence_type TEXT,
-                recurrence_interval INTEGER,
-                priority INTEGER,
-                dependencies_json TEXT,
-                max_duration_seconds INTEGER,
-                notify_on_completion BOOLEAN,
-                notify_on_failure BOOLEAN,
-                created_at DATETIME,
-                updated_at DATETIME,
-                status TEXT,
-                result_json TEXT,
-                error_message TEXT,
-                assigned_resources_json TEXT,
-                estimated_duration_seconds INTEGER
-            )
-        ''')
-
-        # Create task execution logs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS task_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task_id TEXT,
-                timestamp DATETIME,
-                status TEXT,
-                message TEXT,
-                FOREIGN KEY (task_id) REFERENCES tasks (id)
-            )
-        ''')
+    def close(self) -> None:
+        """Stop the scheduler and close every idle pooled connection."""
+        if self.running:
+            self.stop_scheduler()
+        while True:
+            try:
+                conn = self._conn_pool.get_nowait()
+            except queue.Empty:
+                return
+            conn.close()
 
-        conn.commit()
-        conn.close()
+    def setup_database(self):
+        """Initialize the database schema for task tracking."""
+        with self._transaction() as cursor:
+            # Create tasks table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tasks (
+                    id TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    description TEXT,
+                    function TEXT,
+                    args_json TEXT,
+                    kwargs_json TEXT,
+                    scheduled_time DATETIME,
+                    recurrence_type TEXT,
+                    recurrence_interval INTEGER,
+                    priority INTEGER,
+                    dependencies_json TEXT,
+                    max_duration_seconds INTEGER,
+                    notify_on_completion BOOLEAN,
+                    notify_on_failure BOOLEAN,
+                    created_at DATETIME,
+                    updated_at DATETIME,
+                    status TEXT,
+                    result_json TEXT,
+                    error_message TEXT,
+                    assigned_resources_json TEXT,
+                    estimated_duration_seconds INTEGER
+                )
+            ''')
+
+            # Create task execution logs table
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS task_logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    task_id TEXT,
+                    timestamp DATETIME,
+                    status TEXT,
+                    message TEXT,
+                    FOREIGN KEY (task_id) REFERENCES tasks (id)
+                )
+            ''')
+
+            # Indexes for status/time scans and per-task log lookups
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_tasks_status_time
+                ON tasks(status, scheduled_time)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_task_logs_task_id
+                ON task_logs(task_id, timestamp)
+            ''')
 
     def add_task(self, task: Task) -> str:
         """Add a new task to the scheduler."""
@@ -203,19 +285,18 @@ class TaskScheduler:
 
     def _save_task_to_db(self, task: Task) -> None:
         """Save task to the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT OR REPLACE INTO tasks
-            (id, name, description, function, args_json, kwargs_json,
-             scheduled_time, recurrence_type, recurrence_interval, priority,
-             dependencies_json, max_duration_seconds, notify_on_completion,
-             notify_on_failure, created_at, updated_at, status,
-             result_json, error_message, assigned_resources_json,
-             estimated_duration_seconds)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        with self._transaction() as cursor:
+            cursor.execute(SQL_SAVE_TASK, self._task_row(task))
+
+    def _persist_task_completion(self, task: Task, log_rows: List[Tuple[str, str, str, str]]) -> None:
+        """Save a finished task and its (task_id, timestamp, status, message) log rows in one transaction."""
+        with self._transaction() as cursor:
+            cursor.execute(SQL_SAVE_TASK, self._task_row(task))
+            cursor.executemany(SQL_LOG_TASK_STATUS, log_rows)
+
+    def _task_row(self, task: Task) -> tuple:
+        """Build the SQL_SAVE_TASK parameters for a task."""
+        return (
             task.id, task.name, task.description, task.function,
             json.dumps(list(task.args)), json.dumps(task.kwargs),
             task.scheduled_time.isoformat(), task.recurrence_type.value,
@@ -227,28 +308,13 @@ class TaskScheduler:
             task.status.value, json.dumps(task.result) if task.result else None,
             task.error_message, json.dumps(task.assigned_resources),
             task.estimated_duration.total_seconds() if task.estimated_duration else None
-        ))
-
-        conn.commit()
-        conn.close()
+        )
 
     def _load_task_from_db(self, task_id: str) -> Optional[Task]:
         """Load a task from the database."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            SELECT id, name, description, function, args_json, kwargs_json,
-                   scheduled_time, recurrence_type, recurrence_interval, priority,
-                   dependencies_json, max_duration_seconds, notify_on_completion,
-                   notify_on_failure, created_at, updated_at, status,
-                   result_json, error_message, assigned_resources_json,
-                   estimated_duration_seconds
-            FROM tasks WHERE id = ?
-        ''', (task_id,))
-
-        row = cursor.fetchone()
-        conn.close()
+        with self._transaction() as cursor:
+            cursor.execute(SQL_LOAD_TASK, (task_id,))
+            row = cursor.fetchone()
 
         if not row:
             return None
@@ -311,8 +377,8 @@ class TaskScheduler:
             task.status = TaskStatus.RUNNING
             self.active_tasks[task.id] = task
 
-        # Log task start
-        self._log_task_status(task.id, TaskStatus.RUNNING, f"Task started execution")
+        # Log rows are written together with the final task row in the finally block
+        log_rows = [(task.id, datetime.now().isoformat(), TaskStatus.RUNNING.value, "Task started execution")]
 
         try:
             # Simulate task execution (in a real implementation, this would call the actual function)
@@ -324,7 +390,8 @@ class TaskScheduler:
             task.result = result
 
             self.logger.info(f"Task '{task.name}' completed successfully")
-            self._log_task_status(task.id, TaskStatus.COMPLETED, f"Task completed successfully")
+            log_rows.append((task.id, datetime.now().isoformat(), TaskStatus.COMPLETED.value,
+                             "Task completed successfully"))
 
             # Handle recurring tasks
             if task.recurrence_type != RecurrenceType.NONE:
@@ -360,15 +427,15 @@ class TaskScheduler:
             task.error_message = str(e)
 
             self.logger.error(f"Task '{task.name}' failed: {str(e)}")
-            self._log_task_status(task.id, TaskStatus.FAILED, f"Task failed: {str(e)}")
+            log_rows.append((task.id, datetime.now().isoformat(), TaskStatus.FAILED.value, f"Task failed: {str(e)}"))
 
             # Retry mechanism (for demonstration)
             if task.recurrence_type == RecurrenceType.NONE:  # Only for non-recurring tasks
                 self._retry_task_if_needed(task)
 
         finally:
-            # Update database
-            self._save_task_to_db(task)
+            # Update database: task row and log rows in one commit
+            self._persist_task_completion(task, log_rows)
 
             # Update in-memory tracking
             if task.id in self.active_tasks:
@@ -420,11 +487,19 @@ class TaskScheduler:
 
     def _dependencies_met(self, task: Task) -> bool:
         """Check if all task dependencies have been met."""
-        for dep_id in task.dependencies:
-            dep_task = self._load_task_from_db(dep_id)
-            if not dep_task or dep_task.status != TaskStatus.COMPLETED:
-                return False
-        return True
+        # Tasks completed by this scheduler are known without a query
+        pending = list(dict.fromkeys(dep_id for dep_id in task.dependencies if dep_id not in self.completed_tasks))
+        if not pending:
+            return True
+
+        # Fetch only the status of the remaining dependencies, in one query
+        placeholders = ", ".join("?" * len(pending))
+        with self._transaction() as cursor:
+            cursor.execute(f"SELECT status FROM tasks WHERE id IN ({placeholders})", pending)
+            statuses = [row[0] for row in cursor.fetchall()]
+
+        # A missing row means the dependency does not exist
+        return len(statuses) == len(pending) and all(status == TaskStatus.COMPLETED.value for status in statuses)
 
     def _calculate_next_occurrence(self, task: Task) -> Optional[datetime]:
         """Calculate the next occurrence of a recurring task."""
@@ -469,19 +544,6 @@ class TaskScheduler:
         # For now, we'll just log the failure
         self.logger.info(f"Not retrying failed task '{task.name}' (ID: {task.id})")
 
-    def _log_task_status(self, task_id: str, status: TaskStatus, message: str) -> None:
-        """Log task status changes."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        cursor.execute('''
-            INSERT INTO task_logs (task_id, timestamp, status, message)
-            VALUES (?, ?, ?, ?)
-        ''', (task_id, datetime.now().isoformat(), status.value, message))
-
-        conn.commit()
-        conn.close()
-
     def start_scheduler(self) -> None:
         """Start the task scheduler."""
         if self.running:
@@ -670,7 +732,7 @@ def main():
         except KeyboardInterrupt:
             print("\nStopping scheduler...")
 
-        scheduler.stop_scheduler()
+        scheduler.close()
         print("Scheduler stopped.")
 
     else:
@@ -683,7 +745,7 @@ def main():
                 time.sleep(1)
         except KeyboardInterrupt:
             print("\nStopping scheduler...")
-            scheduler.stop_scheduler()
+            scheduler.close()
             print("Scheduler stopped.")
 
 